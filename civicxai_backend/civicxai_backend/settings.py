@@ -210,3 +210,10 @@ UAGENTS_GATEWAY_URL = os.getenv("UAGENTS_GATEWAY_URL", "http://127.0.0.1:8003")
 
 # --- AI Provider Agent ---
 AI_PROVIDER_AGENT_ENDPOINT = os.getenv("AI_PROVIDER_AGENT_ENDPOINT", "http://127.0.0.1:8002/submit")
+
+# =====================================================
+# Cognitive AI Configuration
+# =====================================================
+
+# --- Load NLP models in the WSGI master (use with gunicorn --preload) ---
+COGNITIVE_PRELOAD_MODELS = os.getenv("COGNITIVE_PRELOAD_MODELS", "false").lower() == "true"
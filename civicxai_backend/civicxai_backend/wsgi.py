@@ -7,10 +7,22 @@ For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 """
 
+import gc
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'civicxai_backend.settings')
 
 application = get_wsgi_application()
+
+if settings.COGNITIVE_PRELOAD_MODELS:
+    # Load once before gunicorn forks so workers share the model pages
+    from cognitive.processors import concept_extractor, pdf_processor
+    
+    concept_extractor.preload()
+    pdf_processor.preload()
+    
+    # Keep the garbage collector from touching, and so copying, preloaded objects
+    gc.freeze()
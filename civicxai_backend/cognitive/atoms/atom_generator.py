@@ -39,13 +39,16 @@ class AtomGenerator:
             'topics_added': 0
         }
         
+        # Atoms written as MeTTa expressions, added together in one run
+        facts = []
+        
         # Add source node
         self.atomspace.add_node('ConceptNode', source_id)
         self.atomspace.add_link('InheritanceLink', source_id, 'DataSource')
         
         # Add concepts
         for concept in analysis.get('concepts', []):
-            if self._add_concept(concept, source_id):
+            if self._add_concept(concept, source_id, facts):
                 stats['concepts_added'] += 1
         
         # Add entities
@@ -60,14 +63,16 @@ class AtomGenerator:
         
         # Add relationships
         for relationship in analysis.get('relationships', []):
-            if self._add_relationship(relationship):
+            if self._add_relationship(relationship, facts):
                 stats['relationships_added'] += 1
         
+        self.atomspace.add_atoms(facts)
+        
         logger.info(f"Generated atoms from analysis: {stats}")
         return stats
     
-    def _add_concept(self, concept: Dict[str, Any], source_id: str) -> bool:
-        """Add a concept as a node"""
+    def _add_concept(self, concept: Dict[str, Any], source_id: str, facts: List[str]) -> bool:
+        """Add a concept as a node, queueing its importance fact in facts"""
         try:
             concept_text = concept['text']
             concept_id = self._normalize_concept_name(concept_text)
@@ -80,7 +85,7 @@ class AtomGenerator:
             
             # Add importance as property
             importance = concept.get('importance', 0.5)
-            self.atomspace.add_atom(f"(= (importance {concept_id}) {importance})")
+            facts.append(f"(= (importance {concept_id}) {importance})")
             
             return True
         except Exception as e:
@@ -127,8 +132,8 @@ class AtomGenerator:
             logger.error(f"Failed to add topic: {e}")
             return False
     
-    def _add_relationship(self, relationship: Dict[str, Any]) -> bool:
-        """Add a subject-predicate-object relationship"""
+    def _add_relationship(self, relationship: Dict[str, Any], facts: List[str]) -> bool:
+        """Add a subject-predicate-object relationship, queueing its link in facts"""
         try:
             subject = self._normalize_concept_name(relationship['subject'])
             predicate = self._normalize_concept_name(relationship['predicate'])
@@ -141,7 +146,7 @@ class AtomGenerator:
             
             # Add evaluation link
             eval_expr = f"(EvaluationLink (PredicateNode {predicate}) (ListLink (ConceptNode {subject}) (ConceptNode {obj})))"
-            self.atomspace.add_atom(eval_expr)
+            facts.append(eval_expr)
             
             return True
         except Exception as e:
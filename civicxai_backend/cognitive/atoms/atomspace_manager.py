@@ -3,7 +3,11 @@ AtomSpace Manager
 Handles the lifecycle and access to the MeTTa AtomSpace
 """
 import logging
-from hyperon import MeTTa
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Tuple
+from hyperon import MeTTa, AtomKind, E, S
+from cognitive.core.cache import LRUCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -22,6 +26,10 @@ class AtomSpaceManager:
     def __init__(self):
         if not hasattr(self, 'initialized'):
             self.metta = MeTTa()
+            self.generation = 0  # Bumped whenever the AtomSpace may have changed
+            self._generation_lock = threading.Lock()
+            # Parsed query templates; bounded since criteria queries vary per call
+            self._templates = LRUCache(maxsize=256)
             self.initialized = True
             logger.info("AtomSpaceManager initialized.")
 
@@ -31,6 +39,26 @@ class AtomSpaceManager:
         """
         return self.metta.space()
 
+    def get_generation(self) -> int:
+        """
+        Returns a counter that changes whenever atoms are added, so callers
+        can tell whether cached query results are still valid
+        """
+        return self.generation
+
+    def compile(self, template: str) -> "QueryTemplate":
+        """
+        Parses a query template once; later calls with the same string reuse it
+
+        Variables in the template can be bound to symbols per call, e.g.
+        compile("!(match &self (CausalLink $C $x) $x)").bind(C='Poverty').run()
+        """
+        query = self._templates.get(template)
+        if query is None:
+            query = QueryTemplate(self.metta, template)
+            self._templates.put(template, query)
+        return query
+
     def add_atom(self, atom_str: str):
         """
         Adds an atom to the AtomSpace from a string representation
@@ -43,6 +71,94 @@ class AtomSpaceManager:
         except Exception as e:
             logger.error(f"Failed to add atom '{atom_str}': {e}")
             return None
+        finally:
+            self._bump_generation()
+
+    def add_atoms(self, atom_strs: Iterable[str]):
+        """
+        Adds several atoms from their string representations in a single MeTTa run
+        """
+        program = "\n".join(atom_strs)
+        if not program:
+            return []
+        logger.debug("Adding atoms:\n%s", program)
+        try:
+            return self.metta.run(program)
+        except Exception as e:
+            logger.error("Failed to add atoms: %s", e)
+            return None
+        finally:
+            self._bump_generation()
+
+    def _bump_generation(self):
+        """
+        Marks the AtomSpace as changed once a write has finished
+
+        Bumped after the write, even a failed one, so a reader that saw the
+        old generation mid-write can only have cached under the old key
+        """
+        with self._generation_lock:
+            self.generation += 1
+
+class QueryTemplate:
+    """
+    A MeTTa query parsed once and evaluated without going through the parser again
+    """
+
+    def __init__(self, metta: MeTTa, template: str):
+        self.metta = metta
+        self.template = template
+        self.atom = metta.parse_single(template.lstrip().lstrip('!'))
+
+    def bind(self, **values: str) -> "BoundQuery":
+        """
+        Substitutes symbols for the named template variables
+        """
+        return BoundQuery(self.metta, _substitute(self.atom, values))
+
+    def run(self) -> List[str]:
+        """
+        Evaluates the template with no variables bound
+        """
+        return BoundQuery(self.metta, self.atom).run()
+
+
+class BoundQuery:
+    """
+    A parsed query with its template variables bound
+    """
+
+    def __init__(self, metta: MeTTa, atom):
+        self.metta = metta
+        self.atom = atom
+
+    def run(self) -> List[str]:
+        """
+        Evaluates the query, returning each result in its MeTTa text form
+        """
+        return [str(result) for result in self.metta.evaluate_atom(self.atom)]
+
+
+def parse_pair(result: Any) -> Tuple[str, str]:
+    """
+    Splits a two-element match result, either a sequence or an '(a b)' expression string
+    """
+    if isinstance(result, str):
+        first, second = result.strip('()').split(None, 1)
+        return sys.intern(first), sys.intern(second)
+    first, second = result
+    return str(first), str(second)
+
+
+def _substitute(atom, values: Dict[str, str]):
+    """Replace variables named in values with symbols, leaving other variables free"""
+    kind = atom.get_metatype()
+    if kind == AtomKind.VARIABLE:
+        name = atom.get_name()
+        return S(values[name]) if name in values else atom
+    if kind == AtomKind.EXPR:
+        return E(*[_substitute(child, values) for child in atom.get_children()])
+    return atom
 
 # Singleton instance
 _atomspace_manager_instance = None
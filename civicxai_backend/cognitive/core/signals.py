@@ -3,6 +3,10 @@ Signal Handlers for Cognitive AI
 Auto-process DataSource uploads
 """
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.db import connections, transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from explainable_ai.models import DataSource
@@ -13,7 +17,7 @@ logger = logging.getLogger(__name__)
 @receiver(post_save, sender=DataSource)
 def process_data_source(sender, instance, created, **kwargs):
     """
-    Automatically process DataSource when created or updated
+    Queue a newly created DataSource for processing
     
     Args:
         sender: The model class (DataSource)
@@ -25,8 +29,41 @@ def process_data_source(sender, instance, created, **kwargs):
     if not created or not instance.is_active:
         return
     
+    # Ingest in the background once the row is committed, so save() and the
+    # request behind it are not held up by PDF parsing
+    data_source_id = instance.id
+    transaction.on_commit(lambda: queue_data_sources([data_source_id]))
+
+
+def queue_data_sources(data_source_ids):
+    """
+    Queue DataSources for background ingestion
+    
+    The queue lives in this process only. Sources it loses on shutdown
+    keep a pending or processing status, and the ingest_pending_datasources
+    command picks them up again.
+    
+    Args:
+        data_source_ids: Primary keys of the DataSources to process
+    """
+    executor = _get_ingestion_executor()
+    for data_source_id in data_source_ids:
+        executor.submit(process_data_source_task, data_source_id)
+
+
+def process_data_source_task(data_source_id):
+    """
+    Run the ingestion pipeline for a DataSource
+    
+    Args:
+        data_source_id: Primary key of the DataSource to process
+    """
     try:
-        logger.info(f"Auto-processing DataSource: {instance.id} - {instance.title}")
+        instance = DataSource.objects.filter(id=data_source_id).first()
+        if instance is None or not instance.is_active:
+            return
+        
+        logger.info("Auto-processing DataSource: %s - %s", instance.id, instance.title)
         
         # Lazy import to avoid loading heavy dependencies during Django startup
         from cognitive.pipline.ingestion_pipeline import get_ingestion_pipeline
@@ -36,37 +73,72 @@ def process_data_source(sender, instance, created, **kwargs):
         
         # Process based on source type
         if instance.source_type == 'pdf' and instance.file:
-            # Process PDF file
-            pdf_path = instance.file.path
-            result = pipeline.process_pdf_file(pdf_path, source_id)
+            _set_processing_status(instance.id, 'processing')
+            # Hand the pipeline the open file rather than its path; pypdf reads
+            # pages from it on demand, and storages without local paths work too
+            file_name = os.path.basename(instance.file.name)
+            with instance.file.open('rb') as pdf_file:
+                result = pipeline.process_pdf_bytes(pdf_file, file_name, source_id)
             
             if result['success']:
                 # Update summary if empty
                 if not instance.summary:
                     topics = ', '.join(result.get('key_topics', []))
                     instance.summary = f"Auto-extracted topics: {topics}"
-                    instance.save(update_fields=['summary'])
+                    # A queryset update sends no post_save, so the handler isn't re-entered
+                    DataSource.objects.filter(id=instance.id).update(summary=instance.summary)
                 
-                logger.info(f"Successfully processed PDF: {instance.title} - {result['atoms_created']} atoms created")
+                logger.info("Successfully processed PDF: %s - %s atoms created", instance.title, result['atoms_created'])
             else:
-                logger.error(f"Failed to process PDF {instance.title}: {result.get('error')}")
+                logger.error("Failed to process PDF %s: %s", instance.title, result.get('error'))
+            _set_processing_status(instance.id, 'processed' if result['success'] else 'failed')
         
         elif instance.source_type == 'url' and instance.url:
             # For URLs, we'd need to fetch content first
             # This is a placeholder for future implementation
-            logger.info(f"URL processing not yet implemented for: {instance.url}")
+            logger.info("URL processing not yet implemented for: %s", instance.url)
         
         elif instance.source_type == 'document' and instance.summary:
             # Process summary text
+            _set_processing_status(instance.id, 'processing')
             result = pipeline.process_text(instance.summary, source_id)
             
             if result['success']:
-                logger.info(f"Successfully processed text: {instance.title} - {result['atoms_created']} atoms created")
+                logger.info("Successfully processed text: %s - %s atoms created", instance.title, result['atoms_created'])
             else:
-                logger.error(f"Failed to process text {instance.title}: {result.get('error')}")
+                logger.error("Failed to process text %s: %s", instance.title, result.get('error'))
+            _set_processing_status(instance.id, 'processed' if result['success'] else 'failed')
     
     except Exception as e:
-        logger.error(f"Error in auto-processing DataSource {instance.id}: {e}")
+        logger.error("Error in auto-processing DataSource %s: %s", data_source_id, e)
+        _set_processing_status(data_source_id, 'failed')
+    finally:
+        # Worker threads get their own DB connections; don't leak them
+        connections.close_all()
+
+
+def _set_processing_status(data_source_id, status):
+    """Record a DataSource's ingestion status without sending post_save"""
+    try:
+        DataSource.objects.filter(id=data_source_id).update(processing_status=status)
+    except Exception as e:
+        logger.error("Could not mark DataSource %s as %s: %s", data_source_id, status, e)
+
+
+# Background ingestion worker; one thread keeps pipeline runs sequential
+_ingestion_executor = None
+_ingestion_executor_lock = threading.Lock()
+
+
+def _get_ingestion_executor() -> ThreadPoolExecutor:
+    """Get the shared DataSource ingestion executor"""
+    global _ingestion_executor
+    if _ingestion_executor is None:
+        with _ingestion_executor_lock:
+            if _ingestion_executor is None:
+                _ingestion_executor = ThreadPoolExecutor(max_workers=1,
+                                                         thread_name_prefix='datasource-ingest')
+    return _ingestion_executor
 
 
 def register_signals():
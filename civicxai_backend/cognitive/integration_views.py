@@ -64,7 +64,7 @@ class HybridQueryView(APIView):
             orchestrator = get_orchestrator()
             
             # Analyze and route query
-            routing_decision = orchestrator.analyze_query(query, context)
+            routing_decision = orchestrator.analyze_query(query, context).to_dict()
             
             # Override if force_mode specified
             if force_mode != 'auto':
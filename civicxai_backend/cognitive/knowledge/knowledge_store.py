@@ -3,8 +3,9 @@ Knowledge Store
 High-level interface for storing domain-specific knowledge in AtomSpace
 """
 import logging
+from collections import defaultdict
 from typing import Dict, List, Optional, Any
-from cognitive.atoms.atomspace_manager import get_atomspace_manager
+from cognitive.atoms.atomspace_manager import get_atomspace_manager, parse_pair
 
 logger = logging.getLogger(__name__)
 
@@ -215,6 +216,33 @@ class KnowledgeStore:
         query = f"!(match &self (ReferenceLink $source {topic_id}) $source)"
         return self.atomspace.query(query)
     
+    def find_sources_for_topics(self, topics: List[str]) -> Dict[str, List[str]]:
+        """
+        Find data sources for several topics with a single query
+        
+        Args:
+            topics: Topics to search for
+            
+        Returns:
+            Dictionary mapping each topic to its source IDs
+        """
+        topic_names = defaultdict(list)
+        for topic in dict.fromkeys(topics):
+            topic_names[f"Topic_{topic.replace(' ', '_')}"].append(topic)
+        
+        sources = {topic: [] for topic in topics}
+        if not topic_names:
+            return sources
+        
+        # Only the requested topics are matched, not every ReferenceLink
+        query = (f"!(let $topic (superpose ({' '.join(topic_names)})) "
+                 f"(match &self (ReferenceLink $source $topic) ($source $topic)))")
+        for result in self.atomspace.compile(query).run():
+            source, topic_id = parse_pair(result)
+            for topic in topic_names.get(topic_id, ()):
+                sources[topic].append(source)
+        return sources
+    
     # ===== Concept Relationships =====
     
     def add_concept_similarity(self, concept1: str, concept2: str, 
@@ -4,11 +4,38 @@ Intelligently routes queries between simple (MeTTa/Gateway) and complex (OpenCog
 """
 import logging
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Set, FrozenSet
+from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the query text scanned by the pattern checks; keeps the
+# worst-case regex cost predictable for very long pasted prompts
+MAX_QUERY_LENGTH = 2000
+
+# Intent terms in priority order; the first intent with a matched term wins
+_INTENT_PRIORITY: Tuple[Tuple[str, FrozenSet[str]], ...] = (
+    ('calculate', frozenset({'calculate', 'compute', 'score'})),
+    ('explain', frozenset({'explain', 'why', 'how', 'reason'})),
+    ('compare', frozenset({'compare', 'difference', 'versus', 'vs'})),
+    ('analyze', frozenset({'analyze', 'analysis', 'assess'})),
+    ('search', frozenset({'find', 'search', 'what documents', 'which sources', 'show me'})),
+    ('recommend', frozenset({'recommend', 'suggest', 'should'})),
+)
+
+# Requirement terms
+_CALC_TERMS = frozenset({'calculate', 'compute', 'score', 'priority', 'value'})
+_DOC_TERMS = frozenset({'document', 'pdf', 'source', 'paper', 'research', 'policy', 'mention', 'reference'})
+_EXPLAIN_TERMS = frozenset({'why', 'how', 'explain', 'reason', 'because', 'rationale'})
+_COMPARE_TERMS = frozenset({'compare', 'difference', 'versus', 'vs', 'better', 'worse'})
+
+# Every term checked by analyze_query, scanned once per query
+_ALL_TERMS = frozenset().union(
+    _CALC_TERMS, _DOC_TERMS, _EXPLAIN_TERMS, _COMPARE_TERMS,
+    *(terms for _, terms in _INTENT_PRIORITY)
+)
+
 
 class QueryComplexity(Enum):
     """Query complexity levels"""
@@ -27,6 +54,65 @@ class RoutingDecision(Enum):
     HYBRID_GATEWAY = "hybrid_gateway"  # Gateway + OpenCog
 
 
+# Requirement flags packed into QueryAnalysis.flags
+FLAG_REASONING = 1 << 0
+FLAG_EXPLANATION = 1 << 1
+FLAG_DOCUMENTS = 1 << 2
+FLAG_CALCULATION = 1 << 3
+FLAG_COMPARISON = 1 << 4
+FLAG_MULTI_HOP = 1 << 5
+
+# Flags that contribute to the routing rationale text
+_RATIONALE_MASK = FLAG_DOCUMENTS | FLAG_EXPLANATION | FLAG_MULTI_HOP
+
+_FLAG_NAMES = (
+    ('requires_reasoning', FLAG_REASONING),
+    ('requires_explanation', FLAG_EXPLANATION),
+    ('requires_documents', FLAG_DOCUMENTS),
+    ('requires_calculation', FLAG_CALCULATION),
+    ('requires_comparison', FLAG_COMPARISON),
+    ('requires_multi_hop', FLAG_MULTI_HOP),
+)
+
+
+@dataclass(slots=True)
+class QueryAnalysis:
+    """Result of analyzing a single query"""
+    query: str
+    complexity: QueryComplexity = QueryComplexity.SIMPLE
+    flags: int = 0
+    keywords: Tuple[str, ...] = ()
+    intent: str = 'unknown'
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        result = {
+            'query': self.query,
+            'complexity': self.complexity.name,
+            'keywords': list(self.keywords),
+            'intent': self.intent
+        }
+        for name, flag in _FLAG_NAMES:
+            result[name] = bool(self.flags & flag)
+        return result
+
+
+@dataclass(slots=True)
+class RoutingResult:
+    """Routing decision for a query"""
+    routing: RoutingDecision
+    analysis: QueryAnalysis
+    rationale: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'routing': self.routing.value,
+            'analysis': self.analysis.to_dict(),
+            'rationale': self.rationale
+        }
+
+
 class CognitiveOrchestrator:
     """
     Orchestrates query routing between different AI systems
@@ -42,9 +128,18 @@ class CognitiveOrchestrator:
             'cognitive_queries': 0,
             'hybrid_queries': 0
         }
+        
+        # Rationale text only depends on the routing and a few flags, so
+        # every combination is built once up front
+        self._rationales = {
+            (routing, flags): self._build_rationale(routing, flags)
+            for routing in RoutingDecision
+            for flags in range(_RATIONALE_MASK + 1)
+            if flags & ~_RATIONALE_MASK == 0
+        }
         logger.info("Cognitive Orchestrator initialized")
     
-    def analyze_query(self, query: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def analyze_query(self, query: str, context: Optional[Dict[str, Any]] = None) -> QueryAnalysis:
         """
         Analyze query to determine complexity and requirements
         
@@ -53,67 +148,66 @@ class CognitiveOrchestrator:
             context: Optional context information
             
         Returns:
-            Analysis results
+            QueryAnalysis with complexity, requirement flags, keywords and intent
         """
+        query = query[:MAX_QUERY_LENGTH]
         query_lower = query.lower().strip()
         context = context or {}
         
-        analysis = {
-            'query': query,
-            'complexity': QueryComplexity.SIMPLE,
-            'requires_reasoning': False,
-            'requires_explanation': False,
-            'requires_documents': False,
-            'requires_calculation': False,
-            'requires_comparison': False,
-            'requires_multi_hop': False,
-            'keywords': [],
-            'intent': 'unknown'
-        }
+        complexity = QueryComplexity.SIMPLE
+        flags = 0
         
         # Extract keywords
-        analysis['keywords'] = self._extract_keywords(query_lower)
+        keywords = tuple(self._extract_keywords(query_lower))
+        
+        # Scan the query once for every known term
+        matched = self._match_terms(query_lower)
         
         # Detect intent
-        analysis['intent'] = self._detect_intent(query_lower)
+        intent = self._detect_intent(matched)
         
         # Check for calculation needs
-        if self._needs_calculation(query_lower):
-            analysis['requires_calculation'] = True
-            analysis['complexity'] = QueryComplexity.SIMPLE
+        if self._needs_calculation(matched):
+            flags |= FLAG_CALCULATION
+            complexity = QueryComplexity.SIMPLE
         
         # Check for document queries
-        if self._needs_documents(query_lower):
-            analysis['requires_documents'] = True
-            analysis['complexity'] = QueryComplexity.MODERATE
+        if self._needs_documents(matched):
+            flags |= FLAG_DOCUMENTS
+            complexity = QueryComplexity.MODERATE
         
         # Check for explanation needs
-        if self._needs_explanation(query_lower):
-            analysis['requires_explanation'] = True
-            analysis['complexity'] = QueryComplexity.MODERATE
-            analysis['requires_reasoning'] = True
+        if self._needs_explanation(matched):
+            flags |= FLAG_EXPLANATION | FLAG_REASONING
+            complexity = QueryComplexity.MODERATE
         
         # Check for comparison needs
-        if self._needs_comparison(query_lower):
-            analysis['requires_comparison'] = True
-            analysis['complexity'] = QueryComplexity.MODERATE
-            analysis['requires_reasoning'] = True
+        if self._needs_comparison(matched):
+            flags |= FLAG_COMPARISON | FLAG_REASONING
+            complexity = QueryComplexity.MODERATE
         
         # Check for multi-hop reasoning
         if self._needs_multi_hop(query_lower):
-            analysis['requires_multi_hop'] = True
-            analysis['complexity'] = QueryComplexity.COMPLEX
-            analysis['requires_reasoning'] = True
+            flags |= FLAG_MULTI_HOP | FLAG_REASONING
+            complexity = QueryComplexity.COMPLEX
         
         # Check for very complex queries
-        if self._is_very_complex(query_lower, analysis):
-            analysis['complexity'] = QueryComplexity.VERY_COMPLEX
-            analysis['requires_reasoning'] = True
-        
-        logger.info(f"Query analysis: Complexity={analysis['complexity'].name}, Intent={analysis['intent']}")
+        if self._is_very_complex(query_lower, flags):
+            flags |= FLAG_REASONING
+            complexity = QueryComplexity.VERY_COMPLEX
+        
+        analysis = QueryAnalysis(
+            query=query,
+            complexity=complexity,
+            flags=flags,
+            keywords=keywords,
+            intent=intent
+        )
+        
+        logger.info("Query analysis: Complexity=%s, Intent=%s", analysis.complexity.name, analysis.intent)
         return analysis
     
-    def route_query(self, query: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def route_query(self, query: str, context: Optional[Dict[str, Any]] = None) -> RoutingResult:
         """
         Route query to appropriate system based on analysis
         
@@ -122,7 +216,7 @@ class CognitiveOrchestrator:
             context: Optional context
             
         Returns:
-            Routing decision with details
+            RoutingResult with decision, analysis and rationale
         """
         self.routing_stats['total_queries'] += 1
         
@@ -142,39 +236,40 @@ class CognitiveOrchestrator:
         elif routing in [RoutingDecision.HYBRID_METTA, RoutingDecision.HYBRID_GATEWAY]:
             self.routing_stats['hybrid_queries'] += 1
         
-        return {
-            'routing': routing,
-            'analysis': analysis,
-            'rationale': self._get_routing_rationale(routing, analysis)
-        }
+        return RoutingResult(
+            routing=routing,
+            analysis=analysis,
+            rationale=self._get_routing_rationale(routing, analysis)
+        )
     
-    def _determine_routing(self, analysis: Dict[str, Any]) -> RoutingDecision:
+    def _determine_routing(self, analysis: QueryAnalysis) -> RoutingDecision:
         """Determine which system to route to"""
-        complexity = analysis['complexity']
-        intent = analysis['intent']
+        complexity = analysis.complexity
+        intent = analysis.intent
+        flags = analysis.flags
         
         # Document queries → Cognitive (needs knowledge base)
-        if analysis['requires_documents']:
+        if flags & FLAG_DOCUMENTS:
             return RoutingDecision.COGNITIVE
         
         # Multi-hop reasoning → Cognitive
-        if analysis['requires_multi_hop']:
+        if flags & FLAG_MULTI_HOP:
             return RoutingDecision.COGNITIVE
         
         # Simple calculation → MeTTa
-        if complexity == QueryComplexity.SIMPLE and analysis['requires_calculation']:
+        if complexity == QueryComplexity.SIMPLE and flags & FLAG_CALCULATION:
             return RoutingDecision.METTA
         
         # Explanation with calculation → Hybrid MeTTa + Cognitive
-        if analysis['requires_explanation'] and analysis['requires_calculation']:
+        if flags & FLAG_EXPLANATION and flags & FLAG_CALCULATION:
             return RoutingDecision.HYBRID_METTA
         
         # Comparison or analysis → Gateway if available, else Cognitive
-        if intent in ['compare', 'analyze'] and not analysis['requires_explanation']:
+        if intent in ['compare', 'analyze'] and not flags & FLAG_EXPLANATION:
             return RoutingDecision.GATEWAY
         
         # Comparison with explanation → Hybrid Gateway + Cognitive
-        if intent in ['compare', 'analyze'] and analysis['requires_explanation']:
+        if intent in ['compare', 'analyze'] and flags & FLAG_EXPLANATION:
             return RoutingDecision.HYBRID_GATEWAY
         
         # Complex reasoning → Cognitive
@@ -182,7 +277,7 @@ class CognitiveOrchestrator:
             return RoutingDecision.COGNITIVE
         
         # Moderate with reasoning → Cognitive
-        if complexity == QueryComplexity.MODERATE and analysis['requires_reasoning']:
+        if complexity == QueryComplexity.MODERATE and flags & FLAG_REASONING:
             return RoutingDecision.COGNITIVE
         
         # Default to MeTTa for simple queries
@@ -196,74 +291,58 @@ class CognitiveOrchestrator:
         keywords = [w for w in words if w not in stop_words and len(w) > 2]
         return keywords[:5]  # Top 5 keywords
     
-    def _detect_intent(self, query: str) -> str:
-        """Detect user intent from query"""
-        if any(word in query for word in ['calculate', 'compute', 'score']):
-            return 'calculate'
-        
-        if any(word in query for word in ['explain', 'why', 'how', 'reason']):
-            return 'explain'
-        
-        if any(word in query for word in ['compare', 'difference', 'versus', 'vs']):
-            return 'compare'
-        
-        if any(word in query for word in ['analyze', 'analysis', 'assess']):
-            return 'analyze'
-        
-        if any(word in query for word in ['find', 'search', 'what documents', 'which sources', 'show me']):
-            return 'search'
-        
-        if any(word in query for word in ['recommend', 'suggest', 'should']):
-            return 'recommend'
+    def _match_terms(self, query: str) -> Set[str]:
+        """Find all known terms that occur in the query"""
+        return {term for term in _ALL_TERMS if term in query}
+    
+    def _detect_intent(self, matched: Set[str]) -> str:
+        """Detect user intent from matched terms"""
+        for intent, terms in _INTENT_PRIORITY:
+            if not terms.isdisjoint(matched):
+                return intent
         
         return 'general'
     
-    def _needs_calculation(self, query: str) -> bool:
+    def _needs_calculation(self, matched: Set[str]) -> bool:
         """Check if query needs calculation"""
-        calc_terms = ['calculate', 'compute', 'score', 'priority', 'value']
-        return any(term in query for term in calc_terms)
+        return not _CALC_TERMS.isdisjoint(matched)
     
-    def _needs_documents(self, query: str) -> bool:
+    def _needs_documents(self, matched: Set[str]) -> bool:
         """Check if query needs document search"""
-        doc_terms = ['document', 'pdf', 'source', 'paper', 'research', 'policy', 'mention', 'reference']
-        return any(term in query for term in doc_terms)
+        return not _DOC_TERMS.isdisjoint(matched)
     
-    def _needs_explanation(self, query: str) -> bool:
+    def _needs_explanation(self, matched: Set[str]) -> bool:
         """Check if query needs explanation"""
-        explain_terms = ['why', 'how', 'explain', 'reason', 'because', 'rationale']
-        return any(term in query for term in explain_terms)
+        return not _EXPLAIN_TERMS.isdisjoint(matched)
     
-    def _needs_comparison(self, query: str) -> bool:
+    def _needs_comparison(self, matched: Set[str]) -> bool:
         """Check if query needs comparison"""
-        compare_terms = ['compare', 'difference', 'versus', 'vs', 'better', 'worse']
-        return any(term in query for term in compare_terms)
+        return not _COMPARE_TERMS.isdisjoint(matched)
     
     def _needs_multi_hop(self, query: str) -> bool:
         """Check if query needs multi-hop reasoning"""
         multi_hop_indicators = [
             'leads to', 'causes', 'results in', 'relationship between',
-            'if.*then', 'impact on', 'effect of', 'consequence'
+            r'if.{0,80}?then', 'impact on', 'effect of', 'consequence'
         ]
         return any(re.search(pattern, query) for pattern in multi_hop_indicators)
     
-    def _is_very_complex(self, query: str, analysis: Dict[str, Any]) -> bool:
+    def _is_very_complex(self, query: str, flags: int) -> bool:
         """Check if query is very complex"""
-        # Multiple requirements = very complex
-        requirements = sum([
-            analysis['requires_reasoning'],
-            analysis['requires_explanation'],
-            analysis['requires_documents'],
-            analysis['requires_comparison'],
-            analysis['requires_multi_hop']
-        ])
+        # Multiple requirements = very complex (calculation does not count)
+        requirements = bin(flags & ~FLAG_CALCULATION).count('1')
         
         # Long queries with multiple clauses
         has_multiple_clauses = len(query.split('and')) > 2 or len(query.split('or')) > 2
         
         return requirements >= 3 or (requirements >= 2 and has_multiple_clauses)
     
-    def _get_routing_rationale(self, routing: RoutingDecision, analysis: Dict[str, Any]) -> str:
+    def _get_routing_rationale(self, routing: RoutingDecision, analysis: QueryAnalysis) -> str:
         """Get human-readable rationale for routing decision"""
+        return self._rationales[(routing, analysis.flags & _RATIONALE_MASK)]
+    
+    def _build_rationale(self, routing: RoutingDecision, flags: int) -> str:
+        """Build rationale text for a routing decision and requirement flags"""
         rationales = {
             RoutingDecision.METTA: "Simple calculation - using fast MeTTa engine",
             RoutingDecision.GATEWAY: "Analysis required - using uAgents Gateway",
@@ -276,11 +355,11 @@ class CognitiveOrchestrator:
         
         # Add specific reasons
         reasons = []
-        if analysis['requires_documents']:
+        if flags & FLAG_DOCUMENTS:
             reasons.append("document search")
-        if analysis['requires_explanation']:
+        if flags & FLAG_EXPLANATION:
             reasons.append("explanation")
-        if analysis['requires_multi_hop']:
+        if flags & FLAG_MULTI_HOP:
             reasons.append("multi-hop reasoning")
         
         if reasons:
@@ -5,7 +5,9 @@ Calculates confidence scores for reasoning and decisions
 import logging
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
+import numpy as np
 from cognitive.pln.pln_rules import TruthValue, get_pln_engine
+from cognitive.pln.pln_kernels import chain_confidence_k, chain_confidence_batch_k
 
 logger = logging.getLogger(__name__)
 
@@ -57,35 +59,80 @@ class ConfidenceScorer:
                 explanation='No reasoning chain provided'
             )
         
-        components = {}
+        # Steps without a truth value count as zero; a chain without any uses the default
+        has_truth_values = 'truth_value' in chain[0]
+        confidences = np.fromiter(
+            (_step_confidence(step.get('truth_value')) if 'truth_value' in step else 0.0
+             for step in chain),
+            dtype=np.float64, count=len(chain)
+        )
+        evidence_count = sum(1 for step in chain if step.get('evidence'))
         
-        # 1. Chain length factor (shorter is better)
-        chain_length = len(chain)
-        if chain_length == 1:
-            components['chain_length'] = 1.0
-        elif chain_length <= 3:
-            components['chain_length'] = 0.9
-        elif chain_length <= 5:
-            components['chain_length'] = 0.7
-        else:
-            components['chain_length'] = 0.5
+        return self.score_confidences(confidences, evidence_count,
+                                      has_truth_values=has_truth_values)
+    
+    def score_confidences(self, confidences: np.ndarray, evidence_count: int,
+                          has_truth_values: bool = True) -> ConfidenceScore:
+        """
+        Score a reasoning chain's confidence from its step confidences
         
-        # 2. Truth value confidence (average of all steps)
-        if 'truth_value' in chain[0]:
-            avg_confidence = sum(
-                step.get('truth_value', TruthValue(0.5, 0.5)).confidence 
-                for step in chain if 'truth_value' in step
-            ) / len(chain)
-            components['truth_values'] = avg_confidence
-        else:
-            components['truth_values'] = 0.7  # Default
+        Args:
+            confidences: Truth value confidence of each step (float64, non-empty)
+            evidence_count: Number of steps that carry evidence
+            has_truth_values: Whether the steps carry truth values at all
+            
+        Returns:
+            Confidence score
+        """
+        length, truth_values, evidence = chain_confidence_k(confidences, evidence_count)
+        return self._score_chain_components(length, truth_values, evidence,
+                                            confidences.size, has_truth_values)
+    
+    def score_reasoning_chains(self, chains: List[List[Dict[str, Any]]]) -> List[ConfidenceScore]:
+        """
+        Score many independent reasoning chains at once
         
+        Args:
+            chains: Reasoning chains, each a list of steps
+            
+        Returns:
+            Confidence score of each chain, in order
+        """
+        sizes = np.fromiter(map(len, chains), dtype=np.int64, count=len(chains))
+        offsets = np.zeros(len(chains) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        confidences = np.fromiter(
+            (_step_confidence(step.get('truth_value')) if 'truth_value' in step else 0.0
+             for chain in chains for step in chain),
+            dtype=np.float64, count=int(offsets[-1])
+        )
+        evidence_counts = np.fromiter(
+            (sum(1 for step in chain if step.get('evidence')) for chain in chains),
+            dtype=np.int64, count=len(chains)
+        )
+        
+        # Chains are scored in parallel; only building the results stays in Python
+        length, truth_values, evidence = chain_confidence_batch_k(
+            confidences, offsets, evidence_counts)
+        
+        return [
+            self._score_chain_components(length[i], truth_values[i], evidence[i],
+                                         len(chain), 'truth_value' in chain[0])
+            if chain else self.score_reasoning_chain(chain)
+            for i, chain in enumerate(chains)
+        ]
+    
+    def _score_chain_components(self, length: float, truth_values: float, evidence: float,
+                                chain_length: int, has_truth_values: bool) -> ConfidenceScore:
+        """Weigh a chain's confidence components into its score"""
+        # 1. Chain length factor (shorter is better)
+        # 2. Truth value confidence (average of all steps)
         # 3. Evidence quality
-        evidence_count = sum(1 for step in chain if step.get('evidence'))
-        if evidence_count > 0:
-            components['evidence'] = min(1.0, evidence_count / len(chain))
-        else:
-            components['evidence'] = 0.5
+        components = {
+            'chain_length': float(length),
+            'truth_values': float(truth_values) if has_truth_values else 0.7,  # Default
+            'evidence': float(evidence)
+        }
         
         # Calculate overall score (weighted average)
         weights = {'chain_length': 0.3, 'truth_values': 0.5, 'evidence': 0.2}
@@ -297,6 +344,15 @@ class ConfidenceScorer:
             return f"{level.replace('_', ' ').title()} confidence - weaker in: {', '.join(weak_components)}"
 
 
+def _step_confidence(truth_value: Any) -> float:
+    """Confidence of a step's truth value, given as a TruthValue or its dict form"""
+    if truth_value is None:
+        return 0.5
+    if isinstance(truth_value, dict):
+        return truth_value.get('confidence', 0.5)
+    return truth_value.confidence
+
+
 # Singleton instance
 _confidence_scorer_instance = None
 
@@ -3,7 +3,8 @@ Knowledge Ingestion Pipeline
 Orchestrates the entire process of extracting knowledge from documents
 """
 import logging
-from typing import Dict, List, Any, Optional
+from functools import cached_property
+from typing import Dict, List, Any, Optional, BinaryIO, Union
 from pathlib import Path
 
 from cognitive.processors.pdf_processor import get_pdf_processor
@@ -12,6 +13,9 @@ from cognitive.atoms.atom_generator import get_atom_generator
 
 logger = logging.getLogger(__name__)
 
+# Number of ranked topics reported as key_topics
+KEY_TOPICS_LIMIT = 5
+
 
 class IngestionPipeline:
     """
@@ -20,11 +24,26 @@ class IngestionPipeline:
     
     def __init__(self):
         """Initialize ingestion pipeline"""
-        self.pdf_processor = get_pdf_processor()
-        self.concept_extractor = get_concept_extractor()
-        self.atom_generator = get_atom_generator()
         logger.info("Ingestion Pipeline initialized")
     
+    # Stages are built on first use, so seeding domain knowledge never
+    # loads the spaCy model
+    
+    @cached_property
+    def pdf_processor(self):
+        """PDF processor"""
+        return get_pdf_processor()
+    
+    @cached_property
+    def concept_extractor(self):
+        """Concept extractor"""
+        return get_concept_extractor()
+    
+    @cached_property
+    def atom_generator(self):
+        """Atom generator"""
+        return get_atom_generator()
+    
     def process_pdf_file(self, file_path: str, source_id: str) -> Dict[str, Any]:
         """
         Process a PDF file and ingest knowledge
@@ -42,7 +61,7 @@ class IngestionPipeline:
             print(f"Extracted {result['atoms_created']} atoms")
         """
         try:
-            logger.info(f"Starting PDF processing: {file_path}")
+            logger.info("Starting PDF processing: %s", file_path)
             
             # Step 1: Extract text from PDF
             extraction = self.pdf_processor.extract_text_from_file(file_path)
@@ -55,7 +74,9 @@ class IngestionPipeline:
                 }
             
             # Step 2: Analyze text and extract concepts
-            analysis = self.concept_extractor.analyze_document(extraction['text'])
+            analysis = self.concept_extractor.analyze_document(
+                extraction['text'], top_k_topics=KEY_TOPICS_LIMIT
+            )
             
             # Step 3: Generate atoms from analysis
             atom_stats = self.atom_generator.generate_from_analysis(analysis, source_id)
@@ -72,27 +93,28 @@ class IngestionPipeline:
                 'relationships_extracted': len(analysis['relationships']),
                 'atoms_created': sum(atom_stats.values()),
                 'atom_breakdown': atom_stats,
-                'key_topics': analysis['topics'][:5],
+                'key_topics': list(analysis['topics']),
                 'processing_stages': ['extraction', 'analysis', 'atomization']
             }
             
-            logger.info(f"Successfully processed {file_path}: {result['atoms_created']} atoms created")
+            logger.info("Successfully processed %s: %s atoms created", file_path, result['atoms_created'])
             return result
             
         except Exception as e:
-            logger.error(f"Failed to process PDF {file_path}: {e}")
+            logger.error("Failed to process PDF %s: %s", file_path, e)
             return {
                 'success': False,
                 'error': str(e),
                 'source_id': source_id
             }
     
-    def process_pdf_bytes(self, pdf_bytes: bytes, filename: str, source_id: str) -> Dict[str, Any]:
+    def process_pdf_bytes(self, pdf_bytes: Union[bytes, BinaryIO], filename: str,
+                          source_id: str) -> Dict[str, Any]:
         """
         Process PDF from bytes (e.g., uploaded file)
         
         Args:
-            pdf_bytes: PDF content as bytes
+            pdf_bytes: PDF content as bytes, or a seekable binary file object
             filename: Original filename
             source_id: Unique identifier
             
@@ -100,7 +122,7 @@ class IngestionPipeline:
             Processing results
         """
         try:
-            logger.info(f"Starting PDF bytes processing: {filename}")
+            logger.info("Starting PDF bytes processing: %s", filename)
             
             # Step 1: Extract text
             extraction = self.pdf_processor.extract_text_from_bytes(pdf_bytes, filename)
@@ -113,7 +135,9 @@ class IngestionPipeline:
                 }
             
             # Step 2: Analyze
-            analysis = self.concept_extractor.analyze_document(extraction['text'])
+            analysis = self.concept_extractor.analyze_document(
+                extraction['text'], top_k_topics=KEY_TOPICS_LIMIT
+            )
             
             # Step 3: Generate atoms
             atom_stats = self.atom_generator.generate_from_analysis(analysis, source_id)
@@ -129,14 +153,14 @@ class IngestionPipeline:
                 'topics_extracted': len(analysis['topics']),
                 'atoms_created': sum(atom_stats.values()),
                 'atom_breakdown': atom_stats,
-                'key_topics': analysis['topics'][:5]
+                'key_topics': list(analysis['topics'])
             }
             
-            logger.info(f"Successfully processed {filename}: {result['atoms_created']} atoms created")
+            logger.info("Successfully processed %s: %s atoms created", filename, result['atoms_created'])
             return result
             
         except Exception as e:
-            logger.error(f"Failed to process PDF bytes {filename}: {e}")
+            logger.error("Failed to process PDF bytes %s: %s", filename, e)
             return {
                 'success': False,
                 'error': str(e),
@@ -155,10 +179,10 @@ class IngestionPipeline:
             Processing results
         """
         try:
-            logger.info(f"Starting text processing for {source_id}")
+            logger.info("Starting text processing for %s", source_id)
             
             # Analyze text
-            analysis = self.concept_extractor.analyze_document(text)
+            analysis = self.concept_extractor.analyze_document(text, top_k_topics=KEY_TOPICS_LIMIT)
             
             # Generate atoms
             atom_stats = self.atom_generator.generate_from_analysis(analysis, source_id)
@@ -172,14 +196,14 @@ class IngestionPipeline:
                 'topics_extracted': len(analysis['topics']),
                 'atoms_created': sum(atom_stats.values()),
                 'atom_breakdown': atom_stats,
-                'key_topics': analysis['topics'][:5]
+                'key_topics': list(analysis['topics'])
             }
             
-            logger.info(f"Successfully processed text: {result['atoms_created']} atoms created")
+            logger.info("Successfully processed text: %s atoms created", result['atoms_created'])
             return result
             
         except Exception as e:
-            logger.error(f"Failed to process text for {source_id}: {e}")
+            logger.error("Failed to process text for %s: %s", source_id, e)
             return {
                 'success': False,
                 'error': str(e),
@@ -220,7 +244,7 @@ class IngestionPipeline:
             'total_atoms_created': sum(r.get('atoms_created', 0) for r in results if r['success'])
         }
         
-        logger.info(f"Batch processing complete: {successful}/{len(file_paths)} successful")
+        logger.info("Batch processing complete: %s/%s successful", successful, len(file_paths))
         return summary
     
     def initialize_domain_knowledge(self) -> Dict[str, Any]:
@@ -240,7 +264,7 @@ class IngestionPipeline:
                 'stats': stats
             }
         except Exception as e:
-            logger.error(f"Failed to initialize domain knowledge: {e}")
+            logger.error("Failed to initialize domain knowledge: %s", e)
             return {
                 'success': False,
                 'error': str(e)
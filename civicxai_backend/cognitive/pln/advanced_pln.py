@@ -2,23 +2,34 @@
 Advanced PLN Reasoning Engine
 Full implementation with forward/backward chaining and inference control
 """
+import heapq
 import logging
-from typing import Dict, List, Any, Optional, Set, Tuple
+import operator
+from functools import cached_property, lru_cache
+from typing import Dict, FrozenSet, List, Any, Optional, Set, Tuple, NamedTuple
 from dataclasses import dataclass
-from cognitive.pln.pln_rules import TruthValue, get_pln_engine
-from cognitive.atoms.atomspace_manager import get_atomspace_manager
+import numpy as np
+from cognitive.pln.pln_rules import TruthValue, TruthArray, get_pln_engine
+from cognitive.pln.pln_kernels import NUMBA_AVAILABLE, forward_chain_step_k
+from cognitive.core.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Sort key ranking inference results by truth value strength
+_strength_key = operator.attrgetter('truth_value.strength')
 
-@dataclass
+# Marks a cache miss, since None is a valid cached backward chaining result
+_MISSING = object()
+
+
+@dataclass(slots=True, frozen=True)
 class InferenceResult:
     """Result of an inference operation"""
     conclusion: str
     truth_value: TruthValue
-    inference_path: List[str]
-    premises_used: List[str]
-    rules_applied: List[str]
+    inference_path: Tuple[str, ...]
+    premises_used: Tuple[str, ...]
+    rules_applied: Tuple[str, ...]
     depth: int
     
     def to_dict(self) -> Dict[str, Any]:
@@ -29,13 +40,48 @@ class InferenceResult:
                 'strength': self.truth_value.strength,
                 'confidence': self.truth_value.confidence
             },
-            'inference_path': self.inference_path,
-            'premises_used': self.premises_used,
-            'rules_applied': self.rules_applied,
+            'inference_path': list(self.inference_path),
+            'premises_used': list(self.premises_used),
+            'rules_applied': list(self.rules_applied),
             'depth': self.depth
         }
 
 
+class _Proof(NamedTuple):
+    """
+    Backward chaining proof node
+    Linked to the proof of the rule condition, so extending a proof
+    by one step does not copy the path built so far
+    """
+    goal: str
+    truth_value: TruthValue
+    rule_name: Optional[str]
+    premise: Optional['_Proof']
+    depth: int
+    
+    def to_result(self) -> InferenceResult:
+        """Flatten the proof into an InferenceResult"""
+        path = []
+        rules_applied = []
+        node = self
+        while node is not None:
+            path.append(node.goal)
+            if node.rule_name is not None:
+                rules_applied.append(node.rule_name)
+            node = node.premise
+        path.reverse()
+        rules_applied.reverse()
+        
+        return InferenceResult(
+            conclusion=self.goal,
+            truth_value=self.truth_value,
+            inference_path=tuple(path),
+            premises_used=tuple(path[:-1]),
+            rules_applied=tuple(rules_applied),
+            depth=self.depth
+        )
+
+
 class AdvancedPLNEngine:
     """
     Advanced PLN reasoning with forward and backward chaining
@@ -44,63 +90,159 @@ class AdvancedPLNEngine:
     def __init__(self):
         """Initialize advanced PLN engine"""
         self.pln_engine = get_pln_engine()
-        self.atomspace = get_atomspace_manager()
-        self.inference_cache = {}
+        # Backward chaining results, valid until the PLN ruleset changes
+        self.inference_cache = LRUCache(maxsize=4096)
+        self._cache_rules_version = None
         self.max_depth = 5
+        # Inferences weaker than these are pruned instead of chained further
+        self.min_strength = 0.01
+        self.min_confidence = 0.01
         logger.info("Advanced PLN Engine initialized")
     
+    @cached_property
+    def atomspace(self):
+        """AtomSpace manager, imported on first use to keep MeTTa out of import time"""
+        from cognitive.atoms.atomspace_manager import get_atomspace_manager
+        return get_atomspace_manager()
+    
     def forward_chaining(self, premises: List[Tuple[str, TruthValue]], 
-                        max_steps: int = 10) -> List[InferenceResult]:
+                        max_steps: int = 10,
+                        min_confidence: Optional[float] = None,
+                        min_strength: Optional[float] = None) -> List[InferenceResult]:
         """
         Forward chaining: Start from premises and infer conclusions
         
+        Chains breadth-first: a conclusion only fires rules from the next
+        step on, never later rules of its own step, so each result's depth
+        is its number of rule applications from the premises regardless of
+        rule order, and max_steps bounds that chain length.
+        
         Args:
             premises: List of (premise, truth_value) tuples
-            max_steps: Maximum inference steps
+            max_steps: Maximum inference steps, i.e. maximum chain length
+            min_confidence: Prune conclusions below this confidence (engine default if None)
+            min_strength: Prune conclusions below this strength (engine default if None)
             
         Returns:
             List of inference results
         """
+        min_confidence = self.min_confidence if min_confidence is None else min_confidence
+        min_strength = self.min_strength if min_strength is None else min_strength
+        
         results = []
+        step_functions = self.pln_engine.compile_forward_chainer()
         working_set = {p[0]: p[1] for p in premises}
+        frontier = list(working_set)
         
         for step in range(max_steps):
-            new_inferences = []
+            fired = []
             
-            # Try to apply rules to current working set
-            for rule_name, rule in self.pln_engine.get_all_rules().items():
-                condition = rule['condition']
-                
-                if condition in working_set:
-                    # Apply rule
-                    premise_tv = working_set[condition]
-                    rule_tv = rule['truth_value']
-                    
-                    # Deduction: premise + rule → conclusion
-                    conclusion_tv = self.pln_engine.deduction(premise_tv, rule_tv)
-                    conclusion = rule['conclusion']
-                    
-                    if conclusion not in working_set:
-                        new_inferences.append(
-                            InferenceResult(
-                                conclusion=conclusion,
-                                truth_value=conclusion_tv,
-                                inference_path=[condition, conclusion],
-                                premises_used=[condition],
-                                rules_applied=[rule_name],
-                                depth=step + 1
-                            )
-                        )
-                        working_set[conclusion] = conclusion_tv
+            # Only rules whose condition was added in the previous step can fire
+            for condition in frontier:
+                step_function = step_functions.get(condition)
+                if step_function is not None:
+                    step_function(working_set, fired, min_strength, min_confidence)
             
-            if new_inferences:
-                results.extend(new_inferences)
-            else:
+            if not fired:
                 break  # No new inferences
+            
+            for rule_name, condition, conclusion in fired:
+                results.append(
+                    InferenceResult(
+                        conclusion=conclusion,
+                        truth_value=working_set[conclusion],
+                        inference_path=(condition, conclusion),
+                        premises_used=(condition,),
+                        rules_applied=(rule_name,),
+                        depth=step + 1
+                    )
+                )
+            frontier = [conclusion for _, _, conclusion in fired]
         
         logger.info(f"Forward chaining produced {len(results)} inferences")
         return results
     
+    def forward_chaining_array(self, premises: TruthArray,
+                               max_steps: int = 10,
+                               min_confidence: Optional[float] = None,
+                               min_strength: Optional[float] = None) -> TruthArray:
+        """
+        Forward chaining over structure-of-arrays truth values
+        
+        Applies every matching rule of a step as one array operation.
+        
+        Args:
+            premises: Premise facts with truth values
+            max_steps: Maximum inference steps
+            min_confidence: Prune conclusions below this confidence (engine default if None)
+            min_strength: Prune conclusions below this strength (engine default if None)
+            
+        Returns:
+            TruthArray of inferred facts, in inference order
+        """
+        min_confidence = self.min_confidence if min_confidence is None else min_confidence
+        min_strength = self.min_strength if min_strength is None else min_strength
+        
+        encoded = self.pln_engine.get_rule_arrays()
+        facts = dict(encoded['facts'])
+        for name in premises.names:
+            facts.setdefault(name, len(facts))
+        
+        cond_ids = encoded['condition_ids']
+        concl_ids = encoded['conclusion_ids']
+        
+        # Working set truth values packed as (strength, confidence) rows
+        truth = np.zeros((len(facts), 2), dtype=np.float32)
+        strength, confidence = truth[:, 0], truth[:, 1]
+        present = np.zeros(len(facts), dtype=bool)
+        
+        premise_ids = np.array([facts[name] for name in premises.names], dtype=np.int32)
+        strength[premise_ids] = premises.strength
+        confidence[premise_ids] = premises.confidence
+        present[premise_ids] = True
+        active = np.ones(cond_ids.size, dtype=bool)
+        
+        inferred = []
+        if NUMBA_AVAILABLE:
+            # Compiled rule loop, same semantics as the array steps below
+            claimed = np.zeros(len(facts), dtype=bool)
+            out_ids = np.empty(len(facts), dtype=np.int32)
+            for _ in range(max_steps):
+                fired, count = forward_chain_step_k(
+                    cond_ids, concl_ids, encoded['strength'], encoded['confidence'],
+                    strength, confidence, present, active, claimed,
+                    min_strength, min_confidence, out_ids
+                )
+                if fired == 0:
+                    break  # No new inferences
+                inferred.extend(out_ids[:count].tolist())
+        else:
+            for _ in range(max_steps):
+                fired = np.nonzero(active & present[cond_ids] & ~present[concl_ids])[0]
+                if fired.size == 0:
+                    break  # No new inferences
+                
+                # One rule per conclusion, first in rule order
+                _, first = np.unique(concl_ids[fired], return_index=True)
+                fired = fired[np.sort(first)]
+                
+                new = self.pln_engine.deduce_batch(
+                    truth[cond_ids[fired]], encoded['truth_values'][fired]
+                )
+                
+                # Pruned rules can never fire again: their premise is fixed
+                keep = (new[:, 0] >= min_strength) & (new[:, 1] >= min_confidence)
+                active[fired[~keep]] = False
+                
+                dst = concl_ids[fired[keep]]
+                truth[dst] = new[keep]
+                present[dst] = True
+                inferred.extend(dst.tolist())
+        
+        names = list(facts)
+        logger.info(f"Array forward chaining produced {len(inferred)} inferences")
+        return TruthArray([names[i] for i in inferred], strength[inferred], confidence[inferred])
+    
     def backward_chaining(self, goal: str, 
                          known_facts: Dict[str, TruthValue],
                          max_depth: int = 5) -> Optional[InferenceResult]:
@@ -115,45 +257,71 @@ class AdvancedPLNEngine:
         Returns:
             Inference result if goal is proven
         """
+        if self.pln_engine.version != self._cache_rules_version:
+            self.inference_cache.clear()
+            self._cache_rules_version = self.pln_engine.version
+        
+        key = (goal, max_depth, self.min_strength, self.min_confidence,
+               frozenset(known_facts.items()))
+        cached = self.inference_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        
+        # Sub-proofs are memoized per call, since they depend on known_facts
+        proof = self._backward_chain(goal, known_facts, max_depth,
+                                     self.pln_engine.get_all_rules(), {})
+        result = proof.to_result() if proof else None
+        self.inference_cache.put(key, result)
+        return result
+    
+    def _backward_chain(self, goal: str, known_facts: Dict[str, TruthValue],
+                        max_depth: int, rules: Dict[str, Dict[str, Any]],
+                        memo: Dict[Tuple[str, int], Optional[_Proof]]) -> Optional[_Proof]:
+        """Recursive step of backward chaining, memoized per (goal, depth)"""
+        key = (goal, max_depth)
+        if key in memo:
+            return memo[key]
+        
+        result = None
+        
         # Check if goal is already known
         if goal in known_facts:
-            return InferenceResult(
-                conclusion=goal,
-                truth_value=known_facts[goal],
-                inference_path=[goal],
-                premises_used=[],
-                rules_applied=[],
-                depth=0
-            )
-        
-        # Try to find rules that conclude the goal
-        for rule_name, rule in self.pln_engine.get_all_rules().items():
-            if rule['conclusion'] == goal:
+            result = _Proof(goal, known_facts[goal], None, None, 0)
+        elif max_depth > 0:
+            # Try rules that conclude the goal
+            for rule_name in self.pln_engine.get_rules_for_conclusion(goal):
+                rule = rules[rule_name]
                 condition = rule['condition']
                 
                 # Recursively try to prove condition
-                if max_depth > 0:
-                    sub_result = self.backward_chaining(condition, known_facts, max_depth - 1)
-                    
-                    if sub_result:
-                        # Apply rule
-                        rule_tv = rule['truth_value']
-                        conclusion_tv = self.pln_engine.deduction(sub_result.truth_value, rule_tv)
-                        
-                        return InferenceResult(
-                            conclusion=goal,
-                            truth_value=conclusion_tv,
-                            inference_path=sub_result.inference_path + [goal],
-                            premises_used=sub_result.premises_used + [condition],
-                            rules_applied=sub_result.rules_applied + [rule_name],
-                            depth=sub_result.depth + 1
-                        )
+                sub_result = self._backward_chain(condition, known_facts, max_depth - 1, rules, memo)
+                
+                result = self._apply_rule(goal, rule_name, rule, sub_result)
+                if result:
+                    break
         
-        return None
+        memo[key] = result
+        return result
+    
+    def _apply_rule(self, goal: str, rule_name: str, rule: Dict[str, Any],
+                    sub_result: Optional[_Proof]) -> Optional[_Proof]:
+        """Conclude the goal from a proven rule condition, if strong enough"""
+        if not sub_result:
+            return None
+        
+        conclusion_tv = self.pln_engine.deduction(sub_result.truth_value, rule['truth_value'])
+        
+        # Prune proofs too weak to be useful, as in forward chaining
+        if (conclusion_tv.strength < self.min_strength or
+                conclusion_tv.confidence < self.min_confidence):
+            return None
+        
+        return _Proof(goal, conclusion_tv, rule_name, sub_result, sub_result.depth + 1)
     
     def abductive_reasoning(self, observation: str, 
                            possible_causes: List[str],
-                           known_facts: Dict[str, TruthValue]) -> List[InferenceResult]:
+                           known_facts: Dict[str, TruthValue],
+                           top_k: Optional[int] = None) -> List[InferenceResult]:
         """
         Abductive reasoning: Find best explanations for an observation
         
@@ -161,40 +329,43 @@ class AdvancedPLNEngine:
             observation: Observed fact
             possible_causes: List of possible causes
             known_facts: Known facts
+            top_k: Only return the k most plausible explanations
             
         Returns:
             List of explanations ranked by plausibility
         """
         explanations = []
+        rules = self.pln_engine.get_all_rules()
+        obs_tv = known_facts.get(observation, TruthValue(1.0, 0.8))
         
         for cause in possible_causes:
-            # Check if cause could lead to observation
-            rules = self.pln_engine.get_all_rules()
-            
-            for rule_name, rule in rules.items():
-                if rule['condition'] == cause and rule['conclusion'] == observation:
-                    # Found a potential explanation
-                    rule_tv = rule['truth_value']
-                    
-                    # Abduction: observation + rule → cause (hypothesis)
-                    obs_tv = known_facts.get(observation, TruthValue(1.0, 0.8))
-                    cause_tv = self.pln_engine.abduction(rule_tv, obs_tv)
-                    
-                    explanations.append(
-                        InferenceResult(
-                            conclusion=cause,
-                            truth_value=cause_tv,
-                            inference_path=[observation, cause],
-                            premises_used=[observation],
-                            rules_applied=[rule_name],
-                            depth=1
-                        )
+            # Check rules triggered by the cause that lead to the observation
+            for rule_name in self.pln_engine.get_rules_for_condition(cause):
+                rule = rules[rule_name]
+                if rule['conclusion'] != observation:
+                    continue
+                
+                # Abduction: observation + rule → cause (hypothesis)
+                cause_tv = self.pln_engine.abduction(rule['truth_value'], obs_tv)
+                
+                explanations.append(
+                    InferenceResult(
+                        conclusion=cause,
+                        truth_value=cause_tv,
+                        inference_path=(observation, cause),
+                        premises_used=(observation,),
+                        rules_applied=(rule_name,),
+                        depth=1
                     )
-        
-        # Sort by truth value strength
-        explanations.sort(key=lambda x: x.truth_value.strength, reverse=True)
+                )
         
         logger.info(f"Abductive reasoning found {len(explanations)} explanations")
+        
+        # Rank by truth value strength
+        if top_k is not None:
+            return heapq.nlargest(top_k, explanations, key=_strength_key)
+        
+        explanations.sort(key=_strength_key, reverse=True)
         return explanations
     
     def analogical_reasoning(self, source_case: Dict[str, Any],
@@ -213,46 +384,124 @@ class AdvancedPLNEngine:
         similarity = self._calculate_similarity(source_case, target_case)
         
         if similarity > 0.7:  # Threshold for analogical inference
-            # Transfer solution with confidence based on similarity
-            source_solution = source_case.get('solution')
-            
-            if source_solution:
-                tv = TruthValue(0.8, similarity)
-                
-                return InferenceResult(
-                    conclusion=f"Solution_for_{target_case.get('id', 'target')}",
-                    truth_value=tv,
-                    inference_path=[f"Similar_to_{source_case.get('id', 'source')}"],
-                    premises_used=[str(source_case)],
-                    rules_applied=['Analogical_Transfer'],
-                    depth=1
-                )
+            return self._analogical_transfer(source_case, target_case, similarity)
         
         return None
     
+    def analogical_reasoning_batch(self, source_cases: List[Dict[str, Any]],
+                                   target_case: Dict[str, Any]) -> List[InferenceResult]:
+        """
+        Analogical reasoning against a library of known cases
+        
+        Similarities to all source cases are computed in one array pass and
+        results are only built for cases above the threshold.
+        
+        Args:
+            source_cases: Known cases with solutions
+            target_case: New case needing solution
+            
+        Returns:
+            Inferred solutions for target case, in source case order
+        """
+        results = []
+        for i, similarity in self.find_similar_cases(target_case, source_cases):
+            result = self._analogical_transfer(source_cases[i], target_case, similarity)
+            if result:
+                results.append(result)
+        return results
+    
+    def _analogical_transfer(self, source_case: Dict[str, Any], target_case: Dict[str, Any],
+                             similarity: float) -> Optional[InferenceResult]:
+        """Transfer a source case solution with confidence based on similarity"""
+        source_solution = source_case.get('solution')
+        
+        if not source_solution:
+            return None
+        
+        return InferenceResult(
+            conclusion=f"Solution_for_{target_case.get('id', 'target')}",
+            truth_value=TruthValue(0.8, similarity),
+            inference_path=(f"Similar_to_{source_case.get('id', 'source')}",),
+            # Reference the source case by id rather than serializing it
+            premises_used=(str(source_case.get('id', id(source_case))),),
+            rules_applied=('Analogical_Transfer',),
+            depth=1
+        )
+    
     def _calculate_similarity(self, case1: Dict[str, Any], case2: Dict[str, Any]) -> float:
-        """Calculate similarity between two cases"""
-        common_features = set(case1.keys()) & set(case2.keys())
+        """Calculate similarity between two cases, memoized on their contents"""
+        key1, key2 = _case_key(case1), _case_key(case2)
+        if key1 is None or key2 is None:
+            # Unhashable values can't be memoized; compare them as they are
+            return _case_similarity(case1, case2)
+        return _similarity_cached(key1, key2)
+    
+    def _calculate_similarity_batch(self, target_case: Dict[str, Any],
+                                    cases: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Calculate similarity of many cases to one target case
+        
+        Same metric as _calculate_similarity, with the numeric part computed
+        as array operations over a (cases, features) matrix.
+        
+        Args:
+            target_case: Case to compare against
+            cases: Candidate cases
+            
+        Returns:
+            Array of similarities, one per case
+        """
+        features = list(target_case.keys())
+        n_cases, n_features = len(cases), len(features)
+        
+        if n_cases == 0 or n_features == 0:
+            return np.zeros(n_cases)
+        
+        target_numeric = np.array([_is_numeric(target_case[f]) for f in features])
+        target_values = np.array([target_case[f] if numeric else 0.0
+                                  for f, numeric in zip(features, target_numeric)], dtype=float)
+        
+        values = np.zeros((n_cases, n_features))
+        present = np.zeros((n_cases, n_features), dtype=bool)
+        numeric = np.zeros((n_cases, n_features), dtype=bool)
+        matches = np.zeros((n_cases, n_features), dtype=bool)
         
-        if not common_features:
-            return 0.0
+        # Pack case features; non-numeric features are compared here
+        for i, case in enumerate(cases):
+            for j, feature in enumerate(features):
+                if feature not in case:
+                    continue
+                present[i, j] = True
+                value = case[feature]
+                if target_numeric[j] and _is_numeric(value):
+                    numeric[i, j] = True
+                    values[i, j] = value
+                elif value == target_case[feature]:
+                    matches[i, j] = True
+        
+        denom = np.maximum(np.maximum(np.abs(values), np.abs(target_values)), 1.0)
+        sims = np.where(numeric, 1.0 - np.abs(values - target_values) / denom, matches)
+        totals = np.where(present, sims, 0.0).sum(axis=1)
+        counts = present.sum(axis=1)
+        
+        return np.divide(totals, counts, out=np.zeros(n_cases), where=counts > 0)
+    
+    def find_similar_cases(self, target_case: Dict[str, Any], cases: List[Dict[str, Any]],
+                           threshold: float = 0.7) -> List[Tuple[int, float]]:
+        """
+        Find cases similar enough to the target for analogical transfer
         
-        similarities = []
-        for feature in common_features:
-            v1, v2 = case1[feature], case2[feature]
+        Args:
+            target_case: New case needing solution
+            cases: Case base to search
+            threshold: Minimum similarity
             
-            if isinstance(v1, (int, float)) and isinstance(v2, (int, float)):
-                # Numeric similarity
-                max_val = max(abs(v1), abs(v2), 1.0)
-                sim = 1.0 - abs(v1 - v2) / max_val
-                similarities.append(sim)
-            elif v1 == v2:
-                # Exact match
-                similarities.append(1.0)
-            else:
-                similarities.append(0.0)
-        
-        return sum(similarities) / len(similarities) if similarities else 0.0
+        Returns:
+            List of (case index, similarity) tuples
+        """
+        sims = self._calculate_similarity_batch(target_case, cases)
+        matches = np.where(sims > threshold)[0]
+        return [(int(i), float(sims[i])) for i in matches]
     
     def probabilistic_inference(self, evidence: Dict[str, TruthValue],
                                query: str) -> TruthValue:
@@ -269,10 +518,11 @@ class AdvancedPLNEngine:
         # Simplified probabilistic inference
         # In full PLN, this would use PLN probabilistic formulas
         
-        relevant_evidence = []
-        for fact, tv in evidence.items():
-            if query.lower() in fact.lower():
-                relevant_evidence.append(tv)
+        query_folded = query.casefold()
+        relevant_evidence = [
+            tv for fact, tv in evidence.items()
+            if query_folded in _casefold(fact)
+        ]
         
         if relevant_evidence:
             # Combine evidence using conjunction
@@ -290,6 +540,57 @@ class AdvancedPLNEngine:
         logger.info("Inference cache cleared")
 
 
+@lru_cache(maxsize=4096)
+def _casefold(text: str) -> str:
+    """Casefold a fact name; cached since the same facts recur across queries"""
+    return text.casefold()
+
+
+def _case_key(case: Dict[str, Any]) -> Optional[FrozenSet[Tuple[Any, Any]]]:
+    """Canonical hashable form of a case, or None if any value is unhashable"""
+    try:
+        return frozenset(case.items())
+    except TypeError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _similarity_cached(key1: FrozenSet[Tuple[Any, Any]],
+                       key2: FrozenSet[Tuple[Any, Any]]) -> float:
+    """Calculate similarity between two cases given as canonical keys"""
+    return _case_similarity(dict(key1), dict(key2))
+
+
+def _case_similarity(case1: Dict[str, Any], case2: Dict[str, Any]) -> float:
+    """Calculate similarity between two cases over their common features"""
+    common_features = case1.keys() & case2.keys()
+    
+    if not common_features:
+        return 0.0
+    
+    similarities = []
+    for feature in common_features:
+        v1, v2 = case1[feature], case2[feature]
+        
+        if _is_numeric(v1) and _is_numeric(v2):
+            # Numeric similarity
+            max_val = max(abs(v1), abs(v2), 1.0)
+            sim = 1.0 - abs(v1 - v2) / max_val
+            similarities.append(sim)
+        elif v1 == v2:
+            # Exact match
+            similarities.append(1.0)
+        else:
+            similarities.append(0.0)
+    
+    return sum(similarities) / len(similarities)
+
+
+def _is_numeric(value: Any) -> bool:
+    """Check if a case feature value is compared numerically"""
+    return isinstance(value, (int, float))
+
+
 # Singleton instance
 _advanced_pln_instance = None
 
@@ -0,0 +1,197 @@
+"""
+PLN Truth-Value Kernels
+Pure float arithmetic behind the PLN inference rules, compiled with Numba when available
+"""
+from typing import Tuple
+import numpy as np
+
+# Optional imports - fall back to plain Python if Numba is not installed
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def deduction_k(s1: float, c1: float, s2: float, c2: float) -> Tuple[float, float]:
+    """(A→B) ∧ (B→C) ⊢ (A→C)"""
+    return s1 * s2, min(c1, c2) * 0.9
+
+
+@njit(cache=True, fastmath=True)
+def abduction_k(s1: float, c1: float, s2: float, c2: float) -> Tuple[float, float]:
+    """(A→B) ∧ B ⊢ A"""
+    return s1 * s2 * 0.8, min(c1, c2) * 0.7
+
+
+@njit(cache=True, fastmath=True)
+def induction_k(strength_sum: float, count: int) -> Tuple[float, float]:
+    """Generalization from count instances with the given total strength"""
+    return strength_sum / count, min(0.9, count / 10.0)
+
+
+@njit(cache=True, fastmath=True)
+def conjunction_k(s1: float, c1: float, s2: float, c2: float) -> Tuple[float, float]:
+    """A ∧ B"""
+    return s1 * s2, min(c1, c2)
+
+
+@njit(cache=True, fastmath=True)
+def disjunction_k(s1: float, c1: float, s2: float, c2: float) -> Tuple[float, float]:
+    """A ∨ B"""
+    return s1 + s2 - s1 * s2, min(c1, c2)
+
+
+@njit(cache=True, fastmath=True)
+def negation_k(s: float, c: float) -> Tuple[float, float]:
+    """¬A"""
+    return 1.0 - s, c
+
+
+@njit(cache=True)
+def forward_chain_step_k(cond_ids, concl_ids, rule_s, rule_c,
+                         strength, confidence, present, active, claimed,
+                         min_strength, min_confidence, out_ids):
+    """
+    One forward chaining step over an int-encoded ruleset
+
+    Fires each active rule whose condition was present at the start of the
+    step and whose conclusion is not yet present, taking the first rule in
+    rule order per conclusion. Conclusions meeting the cutoffs are written
+    into the strength/confidence/present arrays and their ids into out_ids;
+    rules that fall below the cutoffs are deactivated. Runs serially since
+    rules sharing a conclusion write to the same slot.
+
+    Returns:
+        (number of rules fired, number of new conclusions written to out_ids)
+    """
+    claimed[:] = False
+    fired = 0
+    count = 0
+    for r in range(cond_ids.size):
+        if not active[r]:
+            continue
+        cid = cond_ids[r]
+        ccid = concl_ids[r]
+        # A claimed fact that is present only became present this step
+        if not present[cid] or claimed[cid] or present[ccid] or claimed[ccid]:
+            continue
+        claimed[ccid] = True
+        fired += 1
+        s = strength[cid] * rule_s[r]
+        c = min(confidence[cid], rule_c[r]) * 0.9
+        if s >= min_strength and c >= min_confidence:
+            strength[ccid] = s
+            confidence[ccid] = c
+            present[ccid] = True
+            out_ids[count] = ccid
+            count += 1
+        else:
+            # Its premise is fixed, so a pruned rule can never fire again
+            active[r] = False
+    return fired, count
+
+
+@njit(cache=True)
+def deduction_scan_k(strengths, confidences):
+    """
+    Running deduction over a sequence of premises, starting from TV(1, 1)
+
+    Returns:
+        (strengths, confidences) arrays holding the conclusion after each premise
+    """
+    n = strengths.size
+    out_s = np.empty(n)
+    out_c = np.empty(n)
+    s = 1.0
+    c = 1.0
+    for i in range(n):
+        s = s * strengths[i]
+        c = min(c, confidences[i]) * 0.9
+        out_s[i] = s
+        out_c[i] = c
+    return out_s, out_c
+
+
+@njit(cache=True)
+def chain_confidence_k(confidences, evidence_count):
+    """
+    Confidence components of a reasoning chain from its step confidences
+
+    Returns:
+        (chain length, average truth value confidence, evidence) components
+    """
+    n = confidences.size
+    if n == 1:
+        length = 1.0
+    elif n <= 3:
+        length = 0.9
+    elif n <= 5:
+        length = 0.7
+    else:
+        length = 0.5
+    total = 0.0
+    for i in range(n):
+        total += confidences[i]
+    if evidence_count > 0:
+        evidence = min(1.0, evidence_count / n)
+    else:
+        evidence = 0.5
+    return length, total / n, evidence
+
+
+@njit(cache=True, parallel=True)
+def chain_confidence_batch_k(confidences, offsets, evidence_counts):
+    """
+    chain_confidence_k over many independent chains, one chain per thread
+
+    Args:
+        confidences: Step confidences of all chains, concatenated
+        offsets: Start of each chain in confidences, plus the total at the end
+        evidence_counts: Number of steps carrying evidence, per chain
+
+    Returns:
+        (chain length, average truth value confidence, evidence) arrays,
+        left at zero for empty chains
+    """
+    n = evidence_counts.size
+    length = np.zeros(n)
+    truth_values = np.zeros(n)
+    evidence = np.zeros(n)
+    for i in prange(n):
+        start = offsets[i]
+        end = offsets[i + 1]
+        if end > start:
+            chain_length, chain_truth, chain_evidence = chain_confidence_k(
+                confidences[start:end], evidence_counts[i])
+            length[i] = chain_length
+            truth_values[i] = chain_truth
+            evidence[i] = chain_evidence
+    return length, truth_values, evidence
+
+
+def warm_up():
+    """Compile the kernels (or load them from Numba's cache) ahead of the first inference"""
+    deduction_k(1.0, 1.0, 1.0, 1.0)
+    abduction_k(1.0, 1.0, 1.0, 1.0)
+    induction_k(1.0, 1)
+    conjunction_k(1.0, 1.0, 1.0, 1.0)
+    disjunction_k(1.0, 1.0, 1.0, 1.0)
+    negation_k(1.0, 1.0)
+    ones = np.ones(1)
+    deduction_scan_k(ones, ones)
+    chain_confidence_k(ones, 1)
+    chain_confidence_batch_k(ones, np.array([0, 1], dtype=np.int64),
+                             np.ones(1, dtype=np.int64))
+
+
+if NUMBA_AVAILABLE:
+    warm_up()
@@ -3,13 +3,20 @@ PLN (Probabilistic Logic Networks) Rules Engine
 Implements reasoning rules with confidence scores
 """
 import logging
-from typing import Dict, List, Tuple, Any, Optional
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple, Any, Optional, Iterable
 from dataclasses import dataclass
+import numpy as np
+from cognitive.pln.pln_kernels import (
+    NUMBA_AVAILABLE, deduction_k, deduction_scan_k, abduction_k, induction_k,
+    conjunction_k, disjunction_k, negation_k
+)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TruthValue:
     """
     Truth value with strength and confidence
@@ -32,6 +39,67 @@ class TruthValue:
         return self.strength > 0.7
 
 
+def confidence_level(confidence: float) -> str:
+    """Bucket a confidence value into high/medium/low"""
+    if confidence > 0.7:
+        return "high"
+    if confidence > 0.5:
+        return "medium"
+    return "low"
+
+
+class TruthArray:
+    """
+    Structure-of-arrays truth values for bulk inference
+    Strengths and confidences are parallel float32 arrays indexed by fact
+    """
+    
+    def __init__(self, names: Iterable[str] = (), strength: Iterable[float] = (),
+                 confidence: Iterable[float] = ()):
+        """
+        Initialize truth array
+        
+        Args:
+            names: Fact names
+            strength: Strength per fact
+            confidence: Confidence per fact
+        """
+        self.names: List[str] = list(names)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.strength = np.asarray(strength, dtype=np.float32)
+        self.confidence = np.asarray(confidence, dtype=np.float32)
+    
+    @classmethod
+    def from_truth_values(cls, facts: Iterable[Tuple[str, TruthValue]]) -> 'TruthArray':
+        """Build from (fact, truth_value) pairs"""
+        facts = list(facts)
+        return cls(
+            [fact for fact, _ in facts],
+            [tv.strength for _, tv in facts],
+            [tv.confidence for _, tv in facts]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+    
+    def get(self, name: str) -> Optional[TruthValue]:
+        """Get scalar truth value of a fact"""
+        i = self.index.get(name)
+        if i is None:
+            return None
+        return TruthValue(float(self.strength[i]), float(self.confidence[i]))
+    
+    def to_truth_values(self) -> Dict[str, TruthValue]:
+        """Convert to a fact -> TruthValue dictionary"""
+        return {
+            name: TruthValue(float(s), float(c))
+            for name, s, c in zip(self.names, self.strength, self.confidence)
+        }
+
+
 class PLNRulesEngine:
     """
     Probabilistic Logic Networks rules for reasoning
@@ -41,6 +109,11 @@ class PLNRulesEngine:
     def __init__(self):
         """Initialize PLN rules engine"""
         self.rules = {}
+        self._rules_by_condition: Dict[str, List[str]] = defaultdict(list)
+        self._rules_by_conclusion: Dict[str, List[str]] = defaultdict(list)
+        self._rule_arrays = None
+        self._forward_chainer = None
+        self.version = 0  # Bumped whenever the ruleset changes
         self._initialize_rules()
         logger.info("PLN Rules Engine initialized")
     
@@ -73,6 +146,22 @@ class PLNRulesEngine:
                 'description': 'High deforestation requires intervention'
             }
         }
+        self._rebuild_index()
+    
+    def _rebuild_index(self):
+        """Rebuild the condition/conclusion -> rule names indexes"""
+        self._rules_by_condition.clear()
+        self._rules_by_conclusion.clear()
+        for rule_name, rule in self.rules.items():
+            self._rules_by_condition[rule['condition']].append(rule_name)
+            self._rules_by_conclusion[rule['conclusion']].append(rule_name)
+        self._invalidate_compiled()
+    
+    def _invalidate_compiled(self):
+        """Drop derived forms of the ruleset after it changes"""
+        self._rule_arrays = None
+        self._forward_chainer = None
+        self.version += 1
     
     def deduction(self, premise1_tv: TruthValue, premise2_tv: TruthValue) -> TruthValue:
         """
@@ -86,10 +175,61 @@ class PLNRulesEngine:
             Truth value of conclusion
         """
         # Simplified PLN deduction formula
-        strength = premise1_tv.strength * premise2_tv.strength
-        confidence = min(premise1_tv.confidence, premise2_tv.confidence) * 0.9
+        return TruthValue(*deduction_k(premise1_tv.strength, premise1_tv.confidence,
+                                       premise2_tv.strength, premise2_tv.confidence))
+    
+    def deduction_array(self, s1: np.ndarray, c1: np.ndarray,
+                        s2: np.ndarray, c2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Deduction over arrays of premises
+        
+        Returns:
+            (strengths, confidences) of the conclusions
+        """
+        return s1 * s2, np.minimum(c1, c2) * np.float32(0.9)
+    
+    def deduction_chain(self, strengths: np.ndarray,
+                        confidences: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Chain deduction through a sequence of premises, starting from TV(1, 1)
+        
+        Args:
+            strengths: float64 array of premise strengths
+            confidences: float64 array of premise confidences
+            
+        Returns:
+            (strengths, confidences) of the conclusion after each premise
+        """
+        if NUMBA_AVAILABLE:
+            return deduction_scan_k(strengths, confidences)
         
-        return TruthValue(strength, confidence)
+        # Interpreted, the kernel would box a NumPy scalar per element;
+        # plain floats keep the fallback loop cheap
+        out_s = []
+        out_c = []
+        s, c = 1.0, 1.0
+        for premise_s, premise_c in zip(strengths.tolist(), confidences.tolist()):
+            s, c = deduction_k(s, c, premise_s, premise_c)
+            out_s.append(s)
+            out_c.append(c)
+        return np.array(out_s, dtype=np.float64), np.array(out_c, dtype=np.float64)
+    
+    def deduce_batch(self, premises: np.ndarray, rules: np.ndarray) -> np.ndarray:
+        """
+        Deduction over packed truth values
+        
+        Args:
+            premises: (N, 2) array of premise (strength, confidence) rows
+            rules: (N, 2) array of rule (strength, confidence) rows
+            
+        Returns:
+            (N, 2) array of conclusion truth values
+        """
+        out = np.empty_like(premises)
+        np.multiply(premises[:, 0], rules[:, 0], out=out[:, 0])
+        np.minimum(premises[:, 1], rules[:, 1], out=out[:, 1])
+        out[:, 1] *= np.float32(0.9)
+        return out
     
     def abduction(self, implication_tv: TruthValue, consequent_tv: TruthValue) -> TruthValue:
         """
@@ -103,10 +243,18 @@ class PLNRulesEngine:
             Truth value of A (hypothesis)
         """
         # Simplified PLN abduction
-        strength = implication_tv.strength * consequent_tv.strength * 0.8
-        confidence = min(implication_tv.confidence, consequent_tv.confidence) * 0.7
+        return TruthValue(*abduction_k(implication_tv.strength, implication_tv.confidence,
+                                       consequent_tv.strength, consequent_tv.confidence))
+    
+    def abduction_array(self, s1: np.ndarray, c1: np.ndarray,
+                        s2: np.ndarray, c2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Abduction over arrays of implications and consequents
         
-        return TruthValue(strength, confidence)
+        Returns:
+            (strengths, confidences) of the hypotheses
+        """
+        return s1 * s2 * np.float32(0.8), np.minimum(c1, c2) * np.float32(0.7)
     
     def induction(self, instances: List[TruthValue]) -> TruthValue:
         """
@@ -118,14 +266,25 @@ class PLNRulesEngine:
         Returns:
             Truth value of generalization
         """
-        if not instances:
+        strengths = np.fromiter((tv.strength for tv in instances), dtype=np.float64,
+                                count=len(instances))
+        return self.induction_array(strengths)
+    
+    def induction_array(self, strengths: np.ndarray) -> TruthValue:
+        """
+        PLN Induction Rule over an array of instance strengths
+        
+        Args:
+            strengths: Strength of each instance
+            
+        Returns:
+            Truth value of generalization
+        """
+        if strengths.size == 0:
             return TruthValue(0.5, 0.0)
         
         # Average strength, increase confidence with more instances
-        avg_strength = sum(tv.strength for tv in instances) / len(instances)
-        confidence = min(0.9, len(instances) / 10.0)  # More instances = higher confidence
-        
-        return TruthValue(avg_strength, confidence)
+        return TruthValue(*induction_k(float(strengths.sum()), int(strengths.size)))
     
     def conjunction(self, tv1: TruthValue, tv2: TruthValue) -> TruthValue:
         """
@@ -138,10 +297,18 @@ class PLNRulesEngine:
         Returns:
             Truth value of A ∧ B
         """
-        strength = tv1.strength * tv2.strength
-        confidence = min(tv1.confidence, tv2.confidence)
+        return TruthValue(*conjunction_k(tv1.strength, tv1.confidence,
+                                         tv2.strength, tv2.confidence))
+    
+    def conjunction_array(self, s1: np.ndarray, c1: np.ndarray,
+                          s2: np.ndarray, c2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Conjunction over arrays of truth values
         
-        return TruthValue(strength, confidence)
+        Returns:
+            (strengths, confidences) of A ∧ B
+        """
+        return s1 * s2, np.minimum(c1, c2)
     
     def disjunction(self, tv1: TruthValue, tv2: TruthValue) -> TruthValue:
         """
@@ -154,10 +321,18 @@ class PLNRulesEngine:
         Returns:
             Truth value of A ∨ B
         """
-        strength = tv1.strength + tv2.strength - (tv1.strength * tv2.strength)
-        confidence = min(tv1.confidence, tv2.confidence)
+        return TruthValue(*disjunction_k(tv1.strength, tv1.confidence,
+                                         tv2.strength, tv2.confidence))
+    
+    def disjunction_array(self, s1: np.ndarray, c1: np.ndarray,
+                          s2: np.ndarray, c2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Disjunction over arrays of truth values
         
-        return TruthValue(strength, confidence)
+        Returns:
+            (strengths, confidences) of A ∨ B
+        """
+        return s1 + s2 - s1 * s2, np.minimum(c1, c2)
     
     def negation(self, tv: TruthValue) -> TruthValue:
         """
@@ -169,7 +344,16 @@ class PLNRulesEngine:
         Returns:
             Truth value of ¬A
         """
-        return TruthValue(1.0 - tv.strength, tv.confidence)
+        return TruthValue(*negation_k(tv.strength, tv.confidence))
+    
+    def negation_array(self, s: np.ndarray, c: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Negation over arrays of truth values
+        
+        Returns:
+            (strengths, confidences) of ¬A
+        """
+        return 1 - s, c.copy()
     
     def apply_rule(self, rule_name: str, evidence: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -273,30 +457,106 @@ class PLNRulesEngine:
             overall_tv = self.conjunction(overall_tv, tv)
         
         explanation_parts = []
+        evidence_items = []
         for fact, tv in evidence:
-            conf_level = "high" if tv.is_high_confidence else "medium" if tv.confidence > 0.5 else "low"
+            conf_level = confidence_level(tv.confidence)
             explanation_parts.append(f"{fact} (confidence: {conf_level}, {tv})")
+            evidence_items.append({
+                'fact': fact,
+                'truth_value': {'strength': tv.strength, 'confidence': tv.confidence},
+                'confidence_level': conf_level
+            })
         
         return {
             'conclusion': conclusion,
             'confidence': overall_tv,
             'evidence_count': len(evidence),
-            'evidence': [
-                {
-                    'fact': fact,
-                    'truth_value': {'strength': tv.strength, 'confidence': tv.confidence},
-                    'confidence_level': "high" if tv.is_high_confidence else "medium" if tv.confidence > 0.5 else "low"
-                }
-                for fact, tv in evidence
-            ],
+            'evidence': evidence_items,
             'explanation': ' AND '.join(explanation_parts),
-            'overall_confidence_level': "high" if overall_tv.is_high_confidence else "medium" if overall_tv.confidence > 0.5 else "low"
+            'overall_confidence_level': confidence_level(overall_tv.confidence)
         }
     
     def get_all_rules(self) -> Dict[str, Dict[str, Any]]:
         """Get all available rules"""
         return self.rules
     
+    def get_rules_for_condition(self, condition: str) -> List[str]:
+        """Get names of rules triggered by a condition"""
+        return self._rules_by_condition.get(condition, [])
+    
+    def get_rules_for_conclusion(self, conclusion: str) -> List[str]:
+        """Get names of rules that conclude a fact"""
+        return self._rules_by_conclusion.get(conclusion, [])
+    
+    def get_rule_arrays(self) -> Dict[str, Any]:
+        """
+        Get the ruleset encoded as integer fact ids and float32 arrays
+        
+        Returns:
+            Dictionary with fact names/index, rule names, condition and
+            conclusion ids, and rule truth values packed as (strength,
+            confidence) rows with strength/confidence column views
+        """
+        if self._rule_arrays is None:
+            facts: Dict[str, int] = {}
+            for rule in self.rules.values():
+                facts.setdefault(rule['condition'], len(facts))
+                facts.setdefault(rule['conclusion'], len(facts))
+            
+            rules = list(self.rules.values())
+            truth_values = np.array([(r['truth_value'].strength, r['truth_value'].confidence)
+                                     for r in rules], dtype=np.float32).reshape(-1, 2)
+            self._rule_arrays = {
+                'facts': facts,
+                'rule_names': list(self.rules.keys()),
+                'condition_ids': np.array([facts[r['condition']] for r in rules], dtype=np.int32),
+                'conclusion_ids': np.array([facts[r['conclusion']] for r in rules], dtype=np.int32),
+                'truth_values': truth_values,
+                'strength': truth_values[:, 0],
+                'confidence': truth_values[:, 1]
+            }
+        return self._rule_arrays
+    
+    def compile_forward_chainer(self) -> Dict[str, Any]:
+        """
+        Generate forward chaining step functions specialized to the ruleset
+        
+        Each condition gets a function with its rules unrolled and their
+        truth values inlined as constants, so applying them involves no
+        rule dict lookups or deduction calls. A function adds new
+        conclusions at or above the strength/confidence cutoffs to the
+        working set and records each firing as a
+        (rule_name, condition, conclusion) tuple in `fired`.
+        
+        Returns:
+            Dictionary of condition -> step function(working_set, fired,
+            min_strength, min_confidence)
+        """
+        if self._forward_chainer is None:
+            lines = []
+            conditions = list(self._rules_by_condition)
+            
+            for i, condition in enumerate(conditions):
+                lines.append(f"def _fc_{i}(ws, fired, min_strength, min_confidence):")
+                lines.append(f"    tv = ws[{condition!r}]")
+                for rule_name in self._rules_by_condition[condition]:
+                    rule = self.rules[rule_name]
+                    conclusion = rule['conclusion']
+                    rule_tv = rule['truth_value']
+                    lines.append(f"    if {conclusion!r} not in ws:")
+                    lines.append(f"        s = tv.strength * {float(rule_tv.strength)!r}")
+                    lines.append(f"        c = min(tv.confidence, {float(rule_tv.confidence)!r}) * 0.9")
+                    lines.append("        if s >= min_strength and c >= min_confidence:")
+                    lines.append(f"            ws[{conclusion!r}] = TruthValue(s, c)")
+                    lines.append(f"            fired.append(({rule_name!r}, {condition!r}, {conclusion!r}))")
+            
+            namespace = {'TruthValue': TruthValue}
+            exec(compile("\n".join(lines), '<pln_forward_chainer>', 'exec'), namespace)
+            self._forward_chainer = {
+                condition: namespace[f"_fc_{i}"] for i, condition in enumerate(conditions)
+            }
+        return self._forward_chainer
+    
     def add_rule(self, rule_name: str, condition: str, conclusion: str, 
                 truth_value: TruthValue, description: str = ""):
         """
@@ -309,12 +569,25 @@ class PLNRulesEngine:
             truth_value: Truth value of the rule
             description: Human-readable description
         """
+        # Interned names make the chaining loops' dict lookups pointer compares
+        rule_name = sys.intern(rule_name)
+        condition = sys.intern(condition)
+        conclusion = sys.intern(conclusion)
+        
+        replaced = rule_name in self.rules
         self.rules[rule_name] = {
             'condition': condition,
             'conclusion': conclusion,
             'truth_value': truth_value,
             'description': description or f"{condition} implies {conclusion}"
         }
+        
+        if replaced:
+            self._rebuild_index()
+        else:
+            self._rules_by_condition[condition].append(rule_name)
+            self._rules_by_conclusion[conclusion].append(rule_name)
+            self._invalidate_compiled()
         logger.info(f"Added rule: {rule_name}")
 
 
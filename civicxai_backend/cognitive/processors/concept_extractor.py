@@ -2,26 +2,70 @@
 Concept Extractor
 Uses NLP to extract concepts, entities, and relationships from text
 """
+import hashlib
 import logging
-from typing import List, Dict, Set, Any, Tuple
+import os
+import sys
+import threading
+from typing import List, Dict, Set, Any, Tuple, Iterable, Iterator, Union
+import numpy as np
 import spacy
+from spacy.attrs import IS_PUNCT, IS_SPACE, IS_STOP, LEMMA, LENGTH
+from spacy.matcher import DependencyMatcher
+from spacy.tokens import Doc
+from cognitive.core.cache import LRUCache
 from collections import Counter
 import re
 
+# Optional imports - keep document analyses on disk across runs when available
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Directory for the on-disk analysis cache; unset keeps analyses in memory only
+ANALYSIS_CACHE_DIR = os.getenv("COGNITIVE_ANALYSIS_CACHE_DIR")
+
+# spaCy model for concept extraction; the small model covers everything used here
+SPACY_MODEL = os.getenv("CIVICXAI_SPACY_MODEL", "en_core_web_sm")
+
+# Pipeline components each extractor does not need, skipped per call.
+# Lemmas need the tagger/attribute_ruler POS, noun chunks need the parser.
+CONCEPT_DISABLED_PIPES = ('ner', 'lemmatizer')
+ENTITY_DISABLED_PIPES = ('tagger', 'parser', 'attribute_ruler', 'lemmatizer')
+KEYWORD_DISABLED_PIPES = ('parser', 'ner')
+RELATIONSHIP_DISABLED_PIPES = ('ner', 'lemmatizer')
+
+# Root verb with a subject child and an object child, matched as (verb, subject, object)
+SVO_PATTERN = [
+    {'RIGHT_ID': 'verb', 'RIGHT_ATTRS': {'DEP': 'ROOT', 'POS': 'VERB'}},
+    {'LEFT_ID': 'verb', 'REL_OP': '>', 'RIGHT_ID': 'subject',
+     'RIGHT_ATTRS': {'DEP': {'IN': ['nsubj', 'nsubjpass']}}},
+    {'LEFT_ID': 'verb', 'REL_OP': '>', 'RIGHT_ID': 'object',
+     'RIGHT_ATTRS': {'DEP': {'IN': ['dobj', 'pobj', 'attr']}}}
+]
+
+# Separates the words of a multi-word concept
+_WHITESPACE = re.compile(r'\s')
+
+# Noun chunks too common to be concepts
+COMMON_CHUNKS = frozenset({'the', 'a', 'an', 'this', 'that'})
+
 
 class ConceptExtractor:
     """
     Extracts concepts and entities from text using NLP
     """
     
-    def __init__(self, model_name: str = 'en_core_web_sm'):
+    def __init__(self, model_name: str = SPACY_MODEL):
         """
         Initialize concept extractor with spaCy model
         
         Args:
-            model_name: spaCy model to use
+            model_name: spaCy model to use (CIVICXAI_SPACY_MODEL by default)
         """
         try:
             self.nlp = spacy.load(model_name)
@@ -38,13 +82,30 @@ class ConceptExtractor:
             'infrastructure', 'education', 'health', 'unemployment',
             'impact', 'assessment', 'analysis', 'recommendation'
         }
+        
+        # Document analyses keyed by a digest of the text, for re-ingestion
+        self._analysis_cache = LRUCache(maxsize=128)
+        
+        # Analyses shared across processes and runs, invalidated by model upgrades
+        self._model_key = f"{model_name}-{self.nlp.meta.get('version', '')}"
+        self._disk_cache = (diskcache.Cache(ANALYSIS_CACHE_DIR)
+                            if DISKCACHE_AVAILABLE and ANALYSIS_CACHE_DIR else None)
+        
+        # Single-pass scan for domain keywords; the lookahead also finds
+        # keywords overlapping a previous match, like repeated `in` checks
+        alternation = '|'.join(map(re.escape, sorted(self.domain_keywords, key=len, reverse=True)))
+        self._domain_regex = re.compile(f'(?=({alternation}))')
+        
+        # Subject-verb-object patterns around a sentence's root verb
+        self._svo_matcher = DependencyMatcher(self.nlp.vocab)
+        self._svo_matcher.add('SVO', [SVO_PATTERN])
     
-    def extract_concepts(self, text: str, min_frequency: int = 2) -> List[Dict[str, Any]]:
+    def extract_concepts(self, text: Union[str, Doc], min_frequency: int = 2) -> List[Dict[str, Any]]:
         """
         Extract key concepts from text
         
         Args:
-            text: Input text
+            text: Input text, or a Doc parsed by this extractor's pipeline
             min_frequency: Minimum frequency for a concept to be included
             
         Returns:
@@ -55,23 +116,23 @@ class ConceptExtractor:
             for concept in concepts:
                 print(f"{concept['text']}: {concept['category']}")
         """
-        doc = self.nlp(text)
-        
+        doc = self._parse(text, CONCEPT_DISABLED_PIPES)
+        return self._concepts_from_doc(doc, min_frequency)
+    
+    def _concepts_from_doc(self, doc: Doc, min_frequency: int = 2) -> List[Dict[str, Any]]:
+        """Extract key concepts from a parsed document"""
         concepts = []
-        concept_counts = Counter()
         
-        # Extract noun chunks as concepts
-        for chunk in doc.noun_chunks:
-            # Clean the chunk
-            chunk_text = chunk.text.lower().strip()
-            
-            # Filter out very short or common words
-            if len(chunk_text) < 3 or chunk_text in ['the', 'a', 'an', 'this', 'that']:
-                continue
-            
-            concept_counts[chunk_text] += 1
+        # Extract noun chunks as concepts, cleaned
+        chunk_texts = (chunk.text.lower().strip() for chunk in doc.noun_chunks)
+        
+        # Filter out very short or common words
+        concept_counts = Counter(
+            chunk_text for chunk_text in chunk_texts
+            if len(chunk_text) >= 3 and chunk_text not in COMMON_CHUNKS
+        )
         
-        # Convert to concept objects
+        # Convert to concept objects (concept texts are already lowercased)
         for text, count in concept_counts.items():
             if count >= min_frequency:
                 concepts.append({
@@ -87,18 +148,21 @@ class ConceptExtractor:
         logger.info(f"Extracted {len(concepts)} concepts from text")
         return concepts
     
-    def extract_entities(self, text: str) -> List[Dict[str, Any]]:
+    def extract_entities(self, text: Union[str, Doc]) -> List[Dict[str, Any]]:
         """
         Extract named entities from text
         
         Args:
-            text: Input text
+            text: Input text, or a Doc parsed by this extractor's pipeline
             
         Returns:
             List of entities with types and metadata
         """
-        doc = self.nlp(text)
-        
+        doc = self._parse(text, ENTITY_DISABLED_PIPES)
+        return self._entities_from_doc(doc)
+    
+    def _entities_from_doc(self, doc: Doc) -> List[Dict[str, Any]]:
+        """Extract named entities from a parsed document"""
         entities = []
         seen_entities = set()
         
@@ -121,92 +185,99 @@ class ConceptExtractor:
         logger.info(f"Extracted {len(entities)} entities from text")
         return entities
     
-    def extract_keywords(self, text: str, top_n: int = 20) -> List[Tuple[str, float]]:
+    def extract_keywords(self, text: Union[str, Doc], top_n: int = 20) -> List[Tuple[str, float]]:
         """
         Extract keywords using frequency and importance scoring
         
         Args:
-            text: Input text
+            text: Input text, or a Doc parsed by this extractor's pipeline
             top_n: Number of top keywords to return
             
         Returns:
             List of (keyword, score) tuples
         """
-        doc = self.nlp(text)
+        doc = self._parse(text, KEYWORD_DISABLED_PIPES)
+        return self._keywords_from_doc(doc, top_n)
+    
+    def _keywords_from_doc(self, doc: Doc, top_n: int = 20) -> List[Tuple[str, float]]:
+        """Extract scored keywords from a parsed document"""
+        # Token attributes as one array: lemma hash, stop/punct/space flags, length
+        attrs = doc.to_array([LEMMA, IS_STOP, IS_PUNCT, IS_SPACE, LENGTH]).reshape(-1, 5)
+        
+        # Skip stop words, punctuation, and short words
+        mask = (attrs[:, 1] == 0) & (attrs[:, 2] == 0) & (attrs[:, 3] == 0) & (attrs[:, 4] > 2)
+        
+        # Count lemma frequencies by hash, in order of first occurrence
+        lemmas, first, counts = np.unique(attrs[mask, 0], return_index=True, return_counts=True)
+        by_first = np.argsort(first)
         
-        # Count word frequencies (excluding stop words)
+        # Resolve each distinct lemma once, merging case variants
+        strings = doc.vocab.strings
         word_freq = Counter()
+        for lemma, count in zip(lemmas[by_first].tolist(), counts[by_first].tolist()):
+            word_freq[strings[lemma].lower()] += count
         
-        for token in doc:
-            # Skip stop words, punctuation, and short words
-            if (not token.is_stop and 
-                not token.is_punct and 
-                not token.is_space and
-                len(token.text) > 2):
-                
-                word = token.lemma_.lower()
-                word_freq[word] += 1
-        
-        # Calculate scores
-        max_freq = max(word_freq.values()) if word_freq else 1
-        
-        scored_keywords = []
-        for word, freq in word_freq.items():
-            # Normalize frequency
-            score = freq / max_freq
-            
-            # Boost domain-specific keywords
-            if word in self.domain_keywords:
-                score *= 1.5
-            
-            scored_keywords.append((word, score))
+        if not word_freq or top_n <= 0:
+            return []
+        
+        words = list(word_freq)
+        freqs = np.fromiter(word_freq.values(), dtype=np.float64, count=len(words))
+        
+        # Normalize frequency, boosting domain-specific keywords
+        scores = freqs / freqs.max()
+        scores[[word in self.domain_keywords for word in words]] *= 1.5
         
-        # Sort and return top N
-        scored_keywords.sort(key=lambda x: x[1], reverse=True)
+        # Select top N without sorting the whole vocabulary; ties go to the
+        # earliest word, as with a stable sort
+        n = min(top_n, len(words))
+        kth = np.partition(scores, len(words) - n)[len(words) - n]
+        above = np.nonzero(scores > kth)[0]
+        selected = np.concatenate([above, np.nonzero(scores == kth)[0][:n - above.size]])
+        selected = selected[np.lexsort((selected, -scores[selected]))]
         
-        return scored_keywords[:top_n]
+        return [(words[i], float(scores[i])) for i in selected.tolist()]
     
-    def extract_relationships(self, text: str) -> List[Dict[str, Any]]:
+    def extract_relationships(self, text: Union[str, Doc]) -> List[Dict[str, Any]]:
         """
         Extract relationships between concepts (subject-verb-object)
         
         Args:
-            text: Input text
+            text: Input text, or a Doc parsed by this extractor's pipeline
             
         Returns:
             List of relationships
         """
-        doc = self.nlp(text)
-        
+        doc = self._parse(text, RELATIONSHIP_DISABLED_PIPES)
+        return self._relationships_from_doc(doc)
+    
+    def _relationships_from_doc(self, doc: Doc) -> List[Dict[str, Any]]:
+        """Extract subject-verb-object relationships from a parsed document"""
         relationships = []
         
-        for sent in doc.sents:
-            # Find subject-verb-object patterns
-            for token in sent:
-                if token.dep_ == 'ROOT' and token.pos_ == 'VERB':
-                    # Find subject
-                    subjects = [child for child in token.children if child.dep_ in ['nsubj', 'nsubjpass']]
-                    # Find object
-                    objects = [child for child in token.children if child.dep_ in ['dobj', 'pobj', 'attr']]
-                    
-                    for subj in subjects:
-                        for obj in objects:
-                            relationships.append({
-                                'subject': subj.text,
-                                'predicate': token.text,
-                                'object': obj.text,
-                                'sentence': sent.text
-                            })
+        # Find subject-verb-object patterns, in document order
+        matches = sorted(token_ids for _, token_ids in self._svo_matcher(doc))
+        sentences = {}
+        
+        for verb, subj, obj in matches:
+            if verb not in sentences:
+                sentences[verb] = doc[verb].sent.text
+            
+            relationships.append({
+                'subject': doc[subj].text,
+                'predicate': doc[verb].text,
+                'object': doc[obj].text,
+                'sentence': sentences[verb]
+            })
         
         logger.info(f"Extracted {len(relationships)} relationships")
         return relationships
     
-    def extract_topics(self, text: str, num_topics: int = 5) -> List[str]:
+    def extract_topics(self, text: Union[str, Doc], num_topics: int = 5) -> List[str]:
         """
         Extract main topics from text
         
         Args:
-            text: Input text
+            text: Input text, or a Doc parsed by this extractor's pipeline
             num_topics: Number of topics to extract
             
         Returns:
@@ -214,23 +285,51 @@ class ConceptExtractor:
         """
         # Get keywords
         keywords = self.extract_keywords(text, top_n=num_topics * 3)
-        
-        # Group related keywords into topics
-        topics = set()
+        return self._topics_from_keywords(keywords, num_topics)
+    
+    def _topics_from_keywords(self, keywords: List[Tuple[str, float]],
+                              num_topics: int = 5) -> List[str]:
+        """Derive main topics from ranked keywords"""
+        # Group related keywords into topics (dict keeps ranking order)
+        topics = {}
         
         for keyword, score in keywords[:num_topics]:
             # Normalize to topic form
             topic = keyword.replace('_', ' ').title()
-            topics.add(topic)
+            topics.setdefault(topic, score)
         
         return list(topics)[:num_topics]
     
-    def _calculate_importance(self, text: str, frequency: int) -> float:
+    def parse_documents(self, texts: Iterable[str], batch_size: int = 50,
+                        n_process: int = 1) -> Iterator[Doc]:
+        """
+        Parse many texts with the full pipeline, for the extract_* methods
+        
+        Parsing once and passing the Doc to several extractors avoids
+        re-running the pipeline for each of them.
+        
+        Args:
+            texts: Texts to parse
+            batch_size: Number of texts per spaCy batch
+            n_process: Number of processes to parse with (-1 for one per CPU)
+            
+        Yields:
+            Parsed Doc for each text, in input order
+        """
+        yield from self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+    
+    def _parse(self, text: Union[str, Doc], disabled: Tuple[str, ...]) -> Doc:
+        """Parse text without the given pipes, or pass an already parsed Doc through"""
+        if isinstance(text, Doc):
+            return text
+        return self.nlp(text, disable=disabled)
+    
+    def _calculate_importance(self, text_lower: str, frequency: int) -> float:
         """
         Calculate importance score for a concept
         
         Args:
-            text: Concept text
+            text_lower: Concept text, already lowercased
             frequency: How often it appears
             
         Returns:
@@ -242,33 +341,90 @@ class ConceptExtractor:
         score += min(frequency / 10.0, 0.5)
         
         # Boost if it's a domain keyword
-        if any(keyword in text.lower() for keyword in self.domain_keywords):
+        if self._domain_regex.search(text_lower):
             score += 0.3
         
-        # Boost for multi-word concepts (usually more specific)
-        if len(text.split()) > 1:
+        # Boost for multi-word concepts (usually more specific); concept
+        # texts are stripped, so any inner whitespace separates two words
+        if _WHITESPACE.search(text_lower):
             score += 0.2
         
         return min(score, 1.0)
     
-    def analyze_document(self, text: str) -> Dict[str, Any]:
+    def analyze_document(self, text: str, top_k_topics: int = 5) -> Dict[str, Any]:
         """
         Comprehensive document analysis
         
+        Recent analyses are cached by text digest, so the returned
+        dictionary may be shared and should not be modified. With diskcache
+        installed and COGNITIVE_ANALYSIS_CACHE_DIR set, analyses are also
+        kept on disk for other processes and later runs.
+        
         Args:
             text: Document text
+            top_k_topics: Number of ranked topics to return
             
         Returns:
             Dictionary with all extracted information
         """
+        # Hashing is far cheaper than parsing, and megabyte strings are slow dict keys
+        key = (hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(), top_k_topics)
+        analysis = self._analysis_cache.get(key)
+        if analysis is not None:
+            logger.info("Using cached document analysis")
+            return analysis
+        
+        disk_key = (self._model_key,) + key
+        if self._disk_cache is not None:
+            analysis = self._disk_cache.get(disk_key)
+            if analysis is not None:
+                logger.info("Using cached document analysis from disk")
+                self._analysis_cache.put(key, analysis)
+                return analysis
+        
         logger.info("Starting comprehensive document analysis")
         
+        # Parse once with the full pipeline and share the doc across extractors
+        analysis = self._analysis_from_doc(self.nlp(text), top_k_topics)
+        self._analysis_cache.put(key, analysis)
+        if self._disk_cache is not None:
+            self._disk_cache.set(disk_key, analysis)
+        return analysis
+    
+    def batch_analyze(self, texts: Iterable[str], top_k_topics: int = 5,
+                      batch_size: int = 50, n_process: int = -1) -> Iterator[Dict[str, Any]]:
+        """
+        Comprehensive analysis of many documents
+        
+        Documents are parsed in batches with nlp.pipe, spread over n_process
+        worker processes (-1 for one per CPU). Use n_process=1 with GPU
+        models, which do not support multiprocessing.
+        
+        Args:
+            texts: Document texts
+            top_k_topics: Number of ranked topics to return per document
+            batch_size: Number of documents per spaCy batch
+            n_process: Number of processes to parse with
+            
+        Yields:
+            Analysis dictionary for each document, in input order
+        """
+        for doc in self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            yield self._analysis_from_doc(doc, top_k_topics)
+    
+    def _analysis_from_doc(self, doc: Doc, top_k_topics: int = 5) -> Dict[str, Any]:
+        """Run every extractor over a parsed document"""
+        text = doc.text
+        
+        # Topics are the top keywords, so rank enough for both
+        ranked_keywords = self._keywords_from_doc(doc, top_n=max(20, top_k_topics))
+        
         analysis = {
-            'concepts': self.extract_concepts(text),
-            'entities': self.extract_entities(text),
-            'keywords': self.extract_keywords(text),
-            'topics': self.extract_topics(text),
-            'relationships': self.extract_relationships(text),
+            'concepts': self._concepts_from_doc(doc),
+            'entities': self._entities_from_doc(doc),
+            'keywords': ranked_keywords[:20],
+            'topics': self._topics_from_keywords(ranked_keywords, num_topics=top_k_topics),
+            'relationships': self._relationships_from_doc(doc),
             'statistics': {
                 'word_count': len(text.split()),
                 'char_count': len(text)
@@ -280,28 +436,26 @@ class ConceptExtractor:
         
         return analysis
     
-    def find_domain_concepts(self, text: str) -> List[str]:
+    def find_domain_concepts(self, text: Union[str, Doc]) -> List[str]:
         """
         Find concepts specific to the CivicXAI domain
         
         Args:
-            text: Document text
+            text: Document text, or a Doc of it
             
         Returns:
             List of domain-specific concepts found
         """
-        text_lower = text.lower()
-        found_concepts = []
-        
-        for keyword in self.domain_keywords:
-            if keyword in text_lower:
-                found_concepts.append(keyword)
-        
-        return found_concepts
+        if isinstance(text, Doc):
+            text = text.text
+        found = set(self._domain_regex.findall(text.lower()))
+        return [keyword for keyword in self.domain_keywords if keyword in found]
 
 
 # Singleton instance
 _concept_extractor_instance = None
+_concept_extractor_lock = threading.Lock()
+_fork_hook_registered = False
 
 
 def get_concept_extractor() -> ConceptExtractor:
@@ -313,5 +467,36 @@ def get_concept_extractor() -> ConceptExtractor:
     """
     global _concept_extractor_instance
     if _concept_extractor_instance is None:
-        _concept_extractor_instance = ConceptExtractor()
+        # Concurrent first callers must not each load the spaCy model
+        with _concept_extractor_lock:
+            if _concept_extractor_instance is None:
+                _concept_extractor_instance = ConceptExtractor()
     return _concept_extractor_instance
+
+
+def preload() -> ConceptExtractor:
+    """
+    Load the spaCy model before server workers fork
+    
+    Call from the WSGI module under gunicorn --preload so the model is
+    loaded once in the master and its pages are shared copy-on-write by
+    the forked workers, instead of every worker loading its own copy.
+    
+    Returns:
+        ConceptExtractor instance
+    """
+    global _fork_hook_registered
+    extractor = get_concept_extractor()
+    # Fork hooks can't be unregistered, so repeated calls must not stack them
+    with _concept_extractor_lock:
+        if not _fork_hook_registered:
+            os.register_at_fork(after_in_child=_limit_worker_threads)
+            _fork_hook_registered = True
+    return extractor
+
+
+def _limit_worker_threads():
+    """Keep forked workers to one torch thread each, if torch is loaded"""
+    torch = sys.modules.get('torch')
+    if torch is not None:
+        torch.set_num_threads(1)
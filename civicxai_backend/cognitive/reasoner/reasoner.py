@@ -3,16 +3,37 @@ Cognitive Reasoner
 Handles reasoning and inference operations using AtomSpace
 Enhanced with PLN rules, confidence scoring, and reasoning chains
 """
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
-from cognitive.atoms.atomspace_manager import get_atomspace_manager
+import re
+import sys
+import threading
+from collections import deque
+from functools import cached_property, lru_cache
+from typing import List, Dict, Any, Optional, Set, Tuple
+import numpy as np
+from cognitive.core.cache import LRUCache
+from cognitive.atoms.atomspace_manager import get_atomspace_manager, parse_pair
 from cognitive.knowledge.knowledge_store import get_knowledge_store
 from cognitive.pln.pln_rules import get_pln_engine, TruthValue
 from cognitive.pipline.confidence_scorer import get_confidence_scorer
 from cognitive.reasoner.reasoning_chain import get_chain_builder, ReasoningChain
 
+# Optional imports - without an embedding model beam search ranks chains equally
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Comparison prefix of a region criterion, e.g. '>0.7'
+_CRITERION = re.compile(r'\s*([<>]=?|==?)\s*(.+)', re.DOTALL)
+
+# Sentence embedding model used to rank multi-hop inference chains
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
 
 class CognitiveReasoner:
     """
@@ -21,15 +42,52 @@ class CognitiveReasoner:
     Phase 3: Enhanced with confidence scoring and reasoning visualization
     """
     
+    # Query keyword -> recommendation handler, checked in order
+    _INTENT_HANDLERS = {
+        'priority': '_recommend_priority',
+        'allocation': '_recommend_priority',
+        'compare': '_recommend_comparison',
+    }
+    
     def __init__(self):
-        """Initialize reasoner with all Phase 3 components"""
+        """Initialize reasoner; Phase 3 components load on first use"""
         self.atomspace = get_atomspace_manager()
-        self.knowledge = get_knowledge_store()
-        self.pln_engine = get_pln_engine()
-        self.confidence_scorer = get_confidence_scorer()
-        self.chain_builder = get_chain_builder()
+        # Pattern-match results keyed by AtomSpace generation; stale ones age out
+        self._query_cache = LRUCache(maxsize=1024)
+        # Reasoning stats that only change with the PLN ruleset
+        self._static_stats = None
+        self._static_stats_version = None
+        # Query templates, parsed once and bound per call
+        self._Q_ALL_REGIONS = self.atomspace.compile("!(match &self (InheritanceLink $r Region) $r)")
+        self._Q_ALL_POLICIES = self.atomspace.compile("!(match &self (InheritanceLink $p Policy) $p)")
+        self._Q_INHERITANCE = self.atomspace.compile("!(match &self (InheritanceLink $child $parent) ($child $parent))")
+        self._Q_SIMILARITY = self.atomspace.compile("!(match &self (SimilarityLink $C $x) $x)")
+        self._Q_CAUSAL = self.atomspace.compile("!(match &self (CausalLink $C $x) $x)")
         logger.info("Cognitive Reasoner initialized with Phase 3 capabilities")
     
+    # Phase 3 components are built on first use, so callers that only
+    # pattern-match never pay for them
+    
+    @cached_property
+    def knowledge(self):
+        """Knowledge store"""
+        return get_knowledge_store()
+    
+    @cached_property
+    def pln_engine(self):
+        """PLN rules engine"""
+        return get_pln_engine()
+    
+    @cached_property
+    def confidence_scorer(self):
+        """Confidence scorer"""
+        return get_confidence_scorer()
+    
+    @property
+    def chain_builder(self):
+        """Reasoning chain builder for the calling thread"""
+        return get_chain_builder()
+    
     def find_related_concepts(self, concept: str, depth: int = 1) -> List[str]:
         """
         Find concepts related to the given concept
@@ -42,47 +100,50 @@ class CognitiveReasoner:
             List of related concept names
         """
         try:
-            related = set()
-            
-            # Find direct relationships
-            query = f"!(match &self (SimilarityLink {concept} $x) $x)"
-            direct_relations = self.atomspace.query(query)
-            related.update(direct_relations)
-            
-            # If depth > 1, recursively find relations
-            if depth > 1:
-                for rel in direct_relations:
-                    nested = self.find_related_concepts(rel, depth - 1)
-                    related.update(nested)
+            # Breadth-first, querying each concept at most once
+            visited = {concept}
+            frontier = deque([(concept, 0)])
+            
+            while frontier:
+                current, current_depth = frontier.popleft()
+                if current_depth >= depth:
+                    continue
+                
+                for related in self._cached_query(self._Q_SIMILARITY, C=current):
+                    if related not in visited:
+                        visited.add(related)
+                        frontier.append((related, current_depth + 1))
             
-            return list(related)
+            visited.discard(concept)
+            return list(visited)
         except Exception as e:
-            logger.error(f"Failed to find related concepts for {concept}: {e}")
+            logger.error("Failed to find related concepts for %s: %s", concept, e)
             return []
     
     def find_regions_matching_criteria(self, criteria: Dict[str, Any]) -> List[str]:
         """
         Find regions that match given criteria
         
+        The criteria are pushed down into a single match, so only matching
+        regions come back from the AtomSpace. Region properties are read as
+        (EvaluationLink (PredicateNode "<name>") (ListLink <region> <value>)).
+        
         Args:
-            criteria: Dictionary of criteria (e.g., {'poverty_index': '>0.7'})
+            criteria: Dictionary of criteria (e.g., {'poverty_index': '>0.7'});
+                plain values are matched for equality
             
         Returns:
             List of matching region IDs
         """
         try:
-            matching_regions = []
-            
-            # Get all regions
-            all_regions_query = "!(match &self (InheritanceLink $r Region) $r)"
-            all_regions = self.atomspace.query(all_regions_query)
+            if not criteria:
+                return self._cached_query(self._Q_ALL_REGIONS)
             
-            # For now, return all regions (filtering logic can be added)
-            # In Phase 2, we'll add proper criteria matching
-            return all_regions
+            template = self.atomspace.compile(_criteria_query(criteria))
+            return list(dict.fromkeys(self._cached_query(template)))
             
         except Exception as e:
-            logger.error(f"Failed to find matching regions: {e}")
+            logger.error("Failed to find matching regions: %s", e)
             return []
     
     def explain_priority(self, region_id: str) -> Dict[str, Any]:
@@ -96,36 +157,54 @@ class CognitiveReasoner:
             Dictionary with explanation details
         """
         try:
-            explanation = {
-                'region': region_id,
-                'reasoning_chain': [],
-                'evidence': [],
-                'confidence': 0.0
-            }
-            
-            # Check if region has high poverty
-            high_poverty_query = f"!(match &self (InheritanceLink {region_id} High_Poverty_Region) High_Poverty_Region)"
-            is_high_poverty = len(self.atomspace.query(high_poverty_query)) > 0
-            
-            if is_high_poverty:
-                explanation['reasoning_chain'].append({
-                    'step': 1,
-                    'condition': f'{region_id} is a High_Poverty_Region',
-                    'inference': 'High poverty regions require priority allocation',
-                    'confidence': 0.9
-                })
-                explanation['confidence'] = 0.9
+            return self.explain_priorities([region_id])[0]
+        except Exception as e:
+            logger.error("Failed to explain priority for %s: %s", region_id, e)
+            return {'error': str(e)}
+    
+    def explain_priorities(self, region_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Generate priority explanations for many regions
+        
+        Classifications and policies for every region come from one
+        AtomSpace query.
+        
+        Args:
+            region_ids: Regions to explain
             
-            # Find relevant policies
-            policy_query = "!(match &self (InheritanceLink $p Policy) $p)"
-            policies = self.atomspace.query(policy_query)
-            explanation['evidence'] = policies
+        Returns:
+            List of explanation dictionaries, in region_ids order; on
+            failure each holds the region and an 'error' message
+        """
+        try:
+            links = self._inheritance_links()
+            classes = self._classify_regions_batch(region_ids, links)
+            policies = [child for child, parent in links if parent == 'Policy']
+            
+            explanations = []
+            for region_id in region_ids:
+                explanation = {
+                    'region': region_id,
+                    'reasoning_chain': [],
+                    'evidence': list(policies),
+                    'confidence': 0.0
+                }
+            
+                if 'High_Poverty_Region' in classes[region_id]:
+                    explanation['reasoning_chain'].append({
+                        'step': 1,
+                        'condition': f'{region_id} is a High_Poverty_Region',
+                        'inference': 'High poverty regions require priority allocation',
+                        'confidence': 0.9
+                    })
+                    explanation['confidence'] = 0.9
             
-            return explanation
+                explanations.append(explanation)
             
+            return explanations
         except Exception as e:
-            logger.error(f"Failed to explain priority for {region_id}: {e}")
-            return {'error': str(e)}
+            logger.error("Failed to explain priorities: %s", e)
+            return [{'region': region_id, 'error': str(e)} for region_id in region_ids]
     
     def compare_regions(self, region1_id: str, region2_id: str) -> Dict[str, Any]:
         """
@@ -148,11 +227,9 @@ class CognitiveReasoner:
             }
             
             # Check poverty classifications
-            high_poverty_query_1 = f"!(match &self (InheritanceLink {region1_id} High_Poverty_Region) High_Poverty_Region)"
-            high_poverty_query_2 = f"!(match &self (InheritanceLink {region2_id} High_Poverty_Region) High_Poverty_Region)"
-            
-            region1_high_poverty = len(self.atomspace.query(high_poverty_query_1)) > 0
-            region2_high_poverty = len(self.atomspace.query(high_poverty_query_2)) > 0
+            classes = self._classify_regions_batch([region1_id, region2_id])
+            region1_high_poverty = 'High_Poverty_Region' in classes[region1_id]
+            region2_high_poverty = 'High_Poverty_Region' in classes[region2_id]
             
             if region1_high_poverty != region2_high_poverty:
                 comparison['differences'].append({
@@ -174,9 +251,65 @@ class CognitiveReasoner:
             return comparison
             
         except Exception as e:
-            logger.error(f"Failed to compare regions: {e}")
+            logger.error("Failed to compare regions: %s", e)
             return {'error': str(e)}
     
+    def _cached_query(self, template, **values: str) -> List[Any]:
+        """
+        Run a query template, reusing the result while the AtomSpace is unchanged
+        
+        Args:
+            template: Compiled query template
+            **values: Symbols bound to the template variables
+            
+        Returns:
+            Query results
+        """
+        # Read before querying; writers bump the generation only after they
+        # finish, so a result taken mid-write is stored under the old key
+        key = (template.template, tuple(sorted(values.items())),
+               self.atomspace.get_generation())
+        results = self._query_cache.get(key)
+        if results is None:
+            # Concept names recur across queries; interned, they hash and compare by identity
+            results = [sys.intern(result) for result in template.bind(**values).run()]
+            self._query_cache.put(key, results)
+        return list(results)
+    
+    def invalidate(self):
+        """Drop cached query results"""
+        self._query_cache.clear()
+    
+    def _inheritance_links(self) -> List[Tuple[str, str]]:
+        """
+        Get every InheritanceLink in the AtomSpace with a single query
+        
+        Returns:
+            List of (child, parent) pairs
+        """
+        return [parse_pair(result) for result in self._cached_query(self._Q_INHERITANCE)]
+    
+    def _classify_regions_batch(self, region_ids: List[str],
+                                links: Optional[List[Tuple[str, str]]] = None) -> Dict[str, Set[str]]:
+        """
+        Get the classifications of many regions in one AtomSpace round-trip
+        
+        Args:
+            region_ids: Regions to classify
+            links: (child, parent) pairs already fetched by _inheritance_links
+            
+        Returns:
+            Dictionary mapping each region ID to the set of its parent classes
+        """
+        if links is None:
+            links = self._inheritance_links()
+        
+        classes = {region_id: set() for region_id in region_ids}
+        for child, parent in links:
+            if child in classes:
+                classes[child].add(parent)
+        return classes
+    
     def find_evidence_for_decision(self, decision: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Find evidence (data sources, policies) supporting a decision
@@ -193,19 +326,19 @@ class CognitiveReasoner:
             
             # Find relevant data sources
             topics = context.get('topics', ['allocation', 'poverty'])
-            for topic in topics:
-                sources = self.knowledge.find_sources_for_topic(topic)
-                for source in sources:
-                    evidence_list.append({
-                        'source_id': source,
-                        'type': 'data_source',
-                        'topic': topic,
-                        'relevance': 0.8
-                    })
+            sources = self.knowledge.find_sources_for_topics(topics)
+            evidence_list.extend(
+                {
+                    'source_id': source,
+                    'type': 'data_source',
+                    'topic': topic,
+                    'relevance': 0.8
+                }
+                for topic in topics for source in sources[topic]
+            )
             
             # Find relevant policies
-            policy_query = "!(match &self (InheritanceLink $p Policy) $p)"
-            policies = self.atomspace.query(policy_query)
+            policies = self._cached_query(self._Q_ALL_POLICIES)
             for policy in policies:
                 evidence_list.append({
                     'source_id': policy,
@@ -216,13 +349,13 @@ class CognitiveReasoner:
             return evidence_list
             
         except Exception as e:
-            logger.error(f"Failed to find evidence: {e}")
+            logger.error("Failed to find evidence: %s", e)
             return []
     
     def infer_causal_chain(self, start_concept: str, end_concept: str, 
                           max_hops: int = 3) -> List[List[str]]:
         """
-        Find causal chains from start to end concept
+        Find a causal chain from start to end concept
         
         Args:
             start_concept: Starting concept
@@ -230,26 +363,43 @@ class CognitiveReasoner:
             max_hops: Maximum chain length
             
         Returns:
-            List of causal chains (each chain is a list of concepts)
+            List holding the first causal chain found (a list of concepts),
+            or an empty list if none exists within max_hops
         """
         try:
-            # Basic implementation - find direct causal link
-            chains = []
-            
-            # Check for direct causal link
-            direct_query = f"!(match &self (CausalLink {start_concept} {end_concept}) {end_concept})"
-            direct_result = self.atomspace.query(direct_query)
-            
-            if direct_result:
-                chains.append([start_concept, end_concept])
-            
-            # For Phase 2: Add multi-hop reasoning
-            # This will use recursive pattern matching
+            # Depth-first with early stopping: one justification is enough,
+            # so the first chain reaching the end concept ends the search.
+            # Deeper paths pop first; among siblings the concept sharing the
+            # most name words with the end concept is expanded first.
+            goal_words = _name_words(end_concept)
+            best_depth = {start_concept: 0}
+            counter = 0
+            stack = [(0, 0, counter, [start_concept])]
+            
+            while stack:
+                _, _, _, path = heapq.heappop(stack)
+                
+                for child in self._cached_query(self._Q_CAUSAL, C=path[-1]):
+                    if child == end_concept:
+                        return [path + [child]]
+                    
+                    # A path at max_hops can still reach the end, but not be extended
+                    if len(path) >= max_hops:
+                        continue
+                    
+                    # Revisit only when reached by a shorter path
+                    if best_depth.get(child, max_hops + 1) <= len(path):
+                        continue
+                    best_depth[child] = len(path)
+                    
+                    counter += 1
+                    overlap = len(goal_words & _name_words(child))
+                    heapq.heappush(stack, (-len(path), -overlap, counter, path + [child]))
             
-            return chains
+            return []
             
         except Exception as e:
-            logger.error(f"Failed to infer causal chain: {e}")
+            logger.error("Failed to infer causal chain: %s", e)
             return []
     
     def generate_recommendation(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -271,29 +421,13 @@ class CognitiveReasoner:
                 'confidence': 0.0
             }
             
-            # Extract key terms from query
-            keywords = query.lower().split()
-            
-            # Check for allocation-related queries
-            if 'priority' in keywords or 'allocation' in keywords:
-                region_id = context.get('region_id')
-                if region_id:
-                    explanation = self.explain_priority(region_id)
-                    recommendation['answer'] = f"Priority assessment for {region_id}"
-                    recommendation['reasoning'] = explanation.get('reasoning_chain', [])
-                    recommendation['evidence'] = explanation.get('evidence', [])
-                    recommendation['confidence'] = explanation.get('confidence', 0.0)
-            
-            # Check for comparison queries
-            elif 'compare' in keywords:
-                region1 = context.get('region1')
-                region2 = context.get('region2')
-                if region1 and region2:
-                    comparison = self.compare_regions(region1, region2)
-                    recommendation['answer'] = comparison.get('recommendation', '')
-                    recommendation['reasoning'] = comparison.get('differences', [])
-                    recommendation['confidence'] = 0.8
+            # Extract key terms from query; the first matching intent wins
+            keywords = set(query.lower().split())
+            handler = next((name for keyword, name in self._INTENT_HANDLERS.items()
+                            if keyword in keywords), None)
             
+            if handler:
+                getattr(self, handler)(recommendation, context)
             else:
                 recommendation['answer'] = "Query type not yet supported in basic reasoning"
                 recommendation['confidence'] = 0.3
@@ -301,9 +435,29 @@ class CognitiveReasoner:
             return recommendation
             
         except Exception as e:
-            logger.error(f"Failed to generate recommendation: {e}")
+            logger.error("Failed to generate recommendation: %s", e)
             return {'error': str(e)}
     
+    def _recommend_priority(self, recommendation: Dict[str, Any], context: Dict[str, Any]):
+        """Fill in a recommendation for an allocation/priority query"""
+        region_id = context.get('region_id')
+        if region_id:
+            explanation = self.explain_priority(region_id)
+            recommendation['answer'] = f"Priority assessment for {region_id}"
+            recommendation['reasoning'] = explanation.get('reasoning_chain', [])
+            recommendation['evidence'] = explanation.get('evidence', [])
+            recommendation['confidence'] = explanation.get('confidence', 0.0)
+    
+    def _recommend_comparison(self, recommendation: Dict[str, Any], context: Dict[str, Any]):
+        """Fill in a recommendation for a region comparison query"""
+        region1 = context.get('region1')
+        region2 = context.get('region2')
+        if region1 and region2:
+            comparison = self.compare_regions(region1, region2)
+            recommendation['answer'] = comparison.get('recommendation', '')
+            recommendation['reasoning'] = comparison.get('differences', [])
+            recommendation['confidence'] = 0.8
+    
     # ===== Phase 3: Advanced Reasoning Methods =====
     
     def reason_with_pln(self, premises: List[Dict[str, Any]], 
@@ -322,25 +476,23 @@ class CognitiveReasoner:
             # Start reasoning chain
             chain = self.chain_builder.start_chain(goal)
             
-            # Apply PLN rules
-            current_tv = TruthValue(1.0, 1.0)
-            
-            for premise in premises:
-                premise_tv = TruthValue(
-                    premise.get('strength', 0.8),
-                    premise.get('confidence', 0.7)
-                )
-                
-                # Apply deduction
-                current_tv = self.pln_engine.deduction(current_tv, premise_tv)
-                
-                chain.add_step(
-                    premise=premise.get('statement', 'premise'),
-                    conclusion=premise.get('conclusion', 'intermediate'),
-                    rule="PLN Deduction",
-                    truth_value=current_tv,
-                    evidence=premise.get('evidence', [])
-                )
+            # Apply PLN deduction across all premises in one pass
+            strengths = np.fromiter((p.get('strength', 0.8) for p in premises),
+                                    dtype=np.float64, count=len(premises))
+            confidences = np.fromiter((p.get('confidence', 0.7) for p in premises),
+                                      dtype=np.float64, count=len(premises))
+            chain_s, chain_c = self.pln_engine.deduction_chain(strengths, confidences)
+            
+            chain.add_steps(
+                {
+                    'premise': premise.get('statement', 'premise'),
+                    'conclusion': premise.get('conclusion', 'intermediate'),
+                    'rule': "PLN Deduction",
+                    'truth_value': TruthValue(s, c),
+                    'evidence': premise.get('evidence', [])
+                }
+                for premise, s, c in zip(premises, chain_s.tolist(), chain_c.tolist())
+            )
             
             # Finalize chain
             result = chain.get_chain_summary()
@@ -349,7 +501,7 @@ class CognitiveReasoner:
             return result
             
         except Exception as e:
-            logger.error(f"PLN reasoning failed: {e}")
+            logger.error("PLN reasoning failed: %s", e)
             return {'success': False, 'error': str(e)}
     
     def explain_with_chain(self, region_id: str) -> Dict[str, Any]:
@@ -366,8 +518,8 @@ class CognitiveReasoner:
             chain = self.chain_builder.start_chain(f"Priority decision for {region_id}")
             
             # Step 1: Check poverty classification
-            high_poverty_query = f"!(match &self (InheritanceLink {region_id} High_Poverty_Region) High_Poverty_Region)"
-            is_high_poverty = len(self.atomspace.query(high_poverty_query)) > 0
+            classes = self._classify_regions_batch([region_id])[region_id]
+            is_high_poverty = 'High_Poverty_Region' in classes
             
             if is_high_poverty:
                 step1_tv = TruthValue(0.9, 0.85)
@@ -397,12 +549,12 @@ class CognitiveReasoner:
             # Get chain summary
             result = chain.get_chain_summary()
             result['success'] = True
-            result['text_explanation'] = chain.current_chain.to_text_explanation() if chain.current_chain else ""
+            result['text_explanation'] = chain.to_text_explanation()
             
             return result
             
         except Exception as e:
-            logger.error(f"Explanation with chain failed: {e}")
+            logger.error("Explanation with chain failed: %s", e)
             return {'success': False, 'error': str(e)}
     
     def compare_with_confidence(self, region1_id: str, region2_id: str) -> Dict[str, Any]:
@@ -440,74 +592,99 @@ class CognitiveReasoner:
             }
             
         except Exception as e:
-            logger.error(f"Comparison with confidence failed: {e}")
+            logger.error("Comparison with confidence failed: %s", e)
             return {'success': False, 'error': str(e)}
     
-    def multi_hop_inference(self, start: str, goal: str, max_hops: int = 3) -> Dict[str, Any]:
+    def multi_hop_inference(self, start: str, goal: str, max_hops: int = 3,
+                            beam_width: int = 3) -> Dict[str, Any]:
         """
         Perform multi-hop inference from start to goal
         
+        Searches similarity links with a beam: at each hop every partial
+        chain is extended by the concepts related to its last concept, and
+        only the beam_width chains whose concepts are on average most
+        semantically similar to the goal are kept.
+        
         Args:
             start: Starting concept
             goal: Goal concept
             max_hops: Maximum reasoning hops
+            beam_width: Number of partial chains kept per hop
             
         Returns:
             Inference result with reasoning chain
         """
         try:
             chain = self.chain_builder.start_chain(f"Infer: {start} → {goal}")
+            path = self._beam_search(start, goal, max_hops, beam_width)
             
-            # Simple 2-hop reasoning for now
-            # In production, would use graph search algorithms
-            
-            # Check for direct link
-            direct_query = f"!(match &self (SimilarityLink {start} {goal}) {goal})"
-            direct_result = self.atomspace.query(direct_query)
-            
-            if direct_result:
-                tv = TruthValue(0.9, 0.8)
+            if path and len(path) == 2:
                 chain.add_step(
                     premise=start,
                     conclusion=goal,
                     rule="Direct Similarity",
-                    truth_value=tv
+                    truth_value=TruthValue(0.9, 0.8)
+                )
+            elif path:
+                link_tv = TruthValue(0.7, 0.7)
+                chain.add_steps(
+                    {
+                        'premise': premise,
+                        'conclusion': conclusion,
+                        'rule': "Similarity Link",
+                        'truth_value': link_tv
+                    }
+                    for premise, conclusion in zip(path, path[1:])
                 )
-            else:
-                # Try finding intermediate concepts
-                related = self.find_related_concepts(start)
-                
-                for intermediate in related[:3]:  # Check top 3
-                    # Check if intermediate connects to goal
-                    intermediate_query = f"!(match &self (SimilarityLink {intermediate} {goal}) {goal})"
-                    if self.atomspace.query(intermediate_query):
-                        # Found 2-hop path
-                        tv1 = TruthValue(0.7, 0.7)
-                        chain.add_step(
-                            premise=start,
-                            conclusion=intermediate,
-                            rule="Similarity Link",
-                            truth_value=tv1
-                        )
-                        
-                        tv2 = TruthValue(0.7, 0.7)
-                        chain.add_step(
-                            premise=intermediate,
-                            conclusion=goal,
-                            rule="Similarity Link",
-                            truth_value=tv2
-                        )
-                        break
             
             result = chain.get_chain_summary()
-            result['success'] = len(chain.current_chain.steps) > 0 if chain.current_chain else False
+            result['success'] = len(chain.steps) > 0
             
             return result
             
         except Exception as e:
-            logger.error(f"Multi-hop inference failed: {e}")
+            logger.error("Multi-hop inference failed: %s", e)
             return {'success': False, 'error': str(e)}
     
+    def _beam_search(self, start: str, goal: str, max_hops: int,
+                     beam_width: int) -> Optional[List[str]]:
+        """
+        Find a similarity path from start to goal with semantic beam search
+        
+        A chain's score is the running average of the cosine similarity of
+        its concepts to the goal.
+        
+        Returns:
+            Path of concepts from start to goal, or None if not found
+        """
+        goal_embedding = _embed(goal)
+        beam = [([start], 0.0)]
+        
+        for hop in range(1, max_hops + 1):
+            candidates = []
+            reached = []
+            
+            for path, score in beam:
+                for concept in self.find_related_concepts(path[-1]):
+                    if concept in path:
+                        continue
+                    if concept == goal:
+                        reached.append((path + [concept], score))
+                        continue
+                    
+                    similarity = _cosine(goal_embedding, _embed(concept))
+                    candidates.append((path + [concept], (score * (hop - 1) + similarity) / hop))
+            
+            # Shortest chains win; among them the most goal-directed
+            if reached:
+                return max(reached, key=lambda x: x[1])[0]
+            
+            beam = heapq.nlargest(beam_width, candidates, key=lambda x: x[1])
+            if not beam:
+                break
+        
+        return None
+    
     def get_reasoning_stats(self) -> Dict[str, Any]:
         """
         Get statistics about reasoning capabilities
@@ -515,29 +692,129 @@ class CognitiveReasoner:
         Returns:
             Dictionary with stats
         """
-        pln_rules = self.pln_engine.get_all_rules()
+        if self.pln_engine.version != self._static_stats_version:
+            pln_rules = self.pln_engine.get_all_rules()
+            self._static_stats = {
+                'reasoning_engine': 'PLN + Pattern Matching (Phase 3)',
+                'pln_rules_count': len(pln_rules),
+                # Tuples, so callers can share them without copying
+                'pln_rules': tuple(pln_rules),
+                'capabilities': (
+                    'concept_similarity',
+                    'pln_based_inference',
+                    'multi_hop_reasoning',
+                    'confidence_scoring',
+                    'reasoning_chain_visualization',
+                    'evidence_finding',
+                    'advanced_explanations'
+                ),
+                'phase': 3,
+                'status': 'active'
+            }
+            self._static_stats_version = self.pln_engine.version
+        
+        # Knowledge base stats are cached alongside query results
+        key = ('knowledge_base_stats', self.atomspace.get_generation())
+        knowledge_stats = self._query_cache.get(key)
+        if knowledge_stats is None:
+            knowledge_stats = self.knowledge.get_knowledge_stats()
+            self._query_cache.put(key, knowledge_stats)
         
         return {
-            'knowledge_base_stats': self.knowledge.get_knowledge_stats(),
-            'reasoning_engine': 'PLN + Pattern Matching (Phase 3)',
-            'pln_rules_count': len(pln_rules),
-            'pln_rules': list(pln_rules.keys()),
-            'capabilities': [
-                'concept_similarity',
-                'pln_based_inference',
-                'multi_hop_reasoning',
-                'confidence_scoring',
-                'reasoning_chain_visualization',
-                'evidence_finding',
-                'advanced_explanations'
-            ],
-            'phase': 3,
-            'status': 'active'
+            'knowledge_base_stats': dict(knowledge_stats),
+            **self._static_stats
         }
 
 
+def _criteria_query(criteria: Dict[str, Any]) -> str:
+    """
+    Build a match over regions whose properties satisfy every criterion
+    
+    Args:
+        criteria: Property name -> comparison string ('>0.7', '<=3', '=urban') or value
+        
+    Returns:
+        MeTTa query string
+    """
+    conjuncts = ["(InheritanceLink $r Region)"]
+    tests = []
+    for i, (name, spec) in enumerate(sorted(criteria.items())):
+        var = f"$v{i}"
+        conjuncts.append(f'(EvaluationLink (PredicateNode {_metta_string(name)}) (ListLink $r {var}))')
+        
+        match = _CRITERION.fullmatch(spec) if isinstance(spec, str) else None
+        if match:
+            op, value = match.groups()
+            op = '==' if op == '=' else op
+        else:
+            op, value = '==', spec
+        tests.append(f"({op} {var} {_metta_literal(value)})")
+    
+    # MeTTa's and is binary
+    condition = tests[-1]
+    for test in reversed(tests[:-1]):
+        condition = f"(and {test} {condition})"
+    
+    return f"!(match &self (, {' '.join(conjuncts)}) (if {condition} $r (empty)))"
+
+
+def _metta_literal(value: Any) -> str:
+    """Render a criterion value as a MeTTa number, boolean or string"""
+    if isinstance(value, bool):
+        return 'True' if value else 'False'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    text = str(value).strip()
+    try:
+        return repr(float(text))
+    except ValueError:
+        return _metta_string(text)
+
+
+def _metta_string(text: Any) -> str:
+    """Render text as a quoted MeTTa string, escaping quotes and backslashes"""
+    return '"' + str(text).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+# Lazily loaded embedding model
+_embedding_model = None
+_embedding_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def _name_words(concept: str) -> frozenset:
+    """Lowercase words of a concept name, e.g. High_Poverty -> {high, poverty}"""
+    return frozenset(concept.lower().split('_'))
+
+
+@lru_cache(maxsize=4096)
+def _embed(concept: str) -> Optional[np.ndarray]:
+    """Get the normalized embedding of a concept name, if a model is available"""
+    global _embedding_model
+    if not SENTENCE_TRANSFORMERS_AVAILABLE:
+        return None
+    if _embedding_model is None:
+        # Concurrent first callers must not each load the model
+        with _embedding_model_lock:
+            if _embedding_model is None:
+                _embedding_model = SentenceTransformer(EMBEDDING_MODEL)
+    embedding = _embedding_model.encode(concept.replace('_', ' '), normalize_embeddings=True)
+    embedding = np.asarray(embedding, dtype=np.float32)
+    # Shared by every caller through the cache
+    embedding.setflags(write=False)
+    return embedding
+
+
+def _cosine(a: Optional[np.ndarray], b: Optional[np.ndarray]) -> float:
+    """Cosine similarity of two normalized embeddings, 0.0 if either is missing"""
+    if a is None or b is None:
+        return 0.0
+    return float(np.dot(a, b))
+
+
 # Singleton instance
 _reasoner_instance = None
+_reasoner_lock = threading.Lock()
 
 
 def get_reasoner() -> CognitiveReasoner:
@@ -549,5 +826,8 @@ def get_reasoner() -> CognitiveReasoner:
     """
     global _reasoner_instance
     if _reasoner_instance is None:
-        _reasoner_instance = CognitiveReasoner()
+        # Concurrent first callers must not each build a reasoner
+        with _reasoner_lock:
+            if _reasoner_instance is None:
+                _reasoner_instance = CognitiveReasoner()
     return _reasoner_instance
@@ -2,24 +2,34 @@
 Reasoning Chain Visualizer
 Creates structured representations of reasoning chains for explanation
 """
+import io
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+import threading
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+from dataclasses import dataclass
+import numpy as np
 from cognitive.pln.pln_rules import TruthValue
 from cognitive.pipline.confidence_scorer import get_confidence_scorer
 
 logger = logging.getLogger(__name__)
 
+# Text explanation lines for a step
+_STEP_TEXT = "**Step {step}:** {premise}\n  ↓ (using: {rule})\n  → {conclusion}"
 
-@dataclass
+# Minimum truth value confidence for a step's high/medium confidence level
+HIGH_CONFIDENCE_STEP = 0.8
+MEDIUM_CONFIDENCE_STEP = 0.6
+
+
+@dataclass(frozen=True, slots=True)
 class ReasoningStep:
-    """Single step in a reasoning chain"""
+    """Single step in a reasoning chain, immutable once created"""
     step_number: int
     premise: str
     conclusion: str
     rule_applied: str
     truth_value: Optional[TruthValue] = None
-    evidence: List[str] = field(default_factory=list)
+    evidence: Tuple[str, ...] = ()
     confidence_level: str = "medium"
     
     def to_dict(self) -> Dict[str, Any]:
@@ -30,10 +40,10 @@ class ReasoningStep:
             'conclusion': self.conclusion,
             'rule': self.rule_applied,
             'truth_value': {
-                'strength': self.truth_value.strength if self.truth_value else 0.5,
-                'confidence': self.truth_value.confidence if self.truth_value else 0.5
+                'strength': self.truth_value.strength,
+                'confidence': self.truth_value.confidence
             } if self.truth_value else None,
-            'evidence': self.evidence,
+            'evidence': list(self.evidence),
             'confidence_level': self.confidence_level
         }
 
@@ -43,6 +53,9 @@ class ReasoningChain:
     Represents a complete reasoning chain from premises to conclusion
     """
     
+    __slots__ = ('goal', 'steps', 'overall_confidence', 'confidence_scorer',
+                 '_premises', '_path', '_path_steps', '_confidence_steps')
+    
     def __init__(self, goal: str):
         """
         Initialize reasoning chain
@@ -54,7 +67,12 @@ class ReasoningChain:
         self.steps: List[ReasoningStep] = []
         self.overall_confidence = None
         self.confidence_scorer = get_confidence_scorer()
-        logger.info(f"Created reasoning chain for goal: {goal}")
+        # Premises, kept in step with self.steps for the summary path
+        self._premises: List[str] = []
+        self._path: Optional[str] = None
+        self._path_steps = -1
+        self._confidence_steps = -1
+        logger.info("Created reasoning chain for goal: %s", goal)
     
     def add_step(self, premise: str, conclusion: str, rule: str,
                  truth_value: Optional[TruthValue] = None,
@@ -74,32 +92,55 @@ class ReasoningChain:
         """
         step_number = len(self.steps) + 1
         
-        # Determine confidence level
-        if truth_value:
-            if truth_value.confidence >= 0.8:
-                conf_level = "high"
-            elif truth_value.confidence >= 0.6:
-                conf_level = "medium"
-            else:
-                conf_level = "low"
-        else:
-            conf_level = "medium"
-        
         step = ReasoningStep(
             step_number=step_number,
             premise=premise,
             conclusion=conclusion,
             rule_applied=rule,
             truth_value=truth_value,
-            evidence=evidence or [],
-            confidence_level=conf_level
+            evidence=tuple(evidence or ()),
+            confidence_level=_step_confidence_level(truth_value)
         )
         
         self.steps.append(step)
-        logger.debug(f"Added reasoning step {step_number}: {premise} → {conclusion}")
+        self._premises.append(premise)
+        self.overall_confidence = None
+        logger.debug("Added reasoning step %s: %s → %s", step_number, premise, conclusion)
         
         return step
     
+    def add_steps(self, steps: Iterable[Dict[str, Any]]) -> List[ReasoningStep]:
+        """
+        Add several steps to the reasoning chain at once
+        
+        Args:
+            steps: Dictionaries with the add_step arguments (premise,
+                conclusion, rule, and optionally truth_value and evidence)
+            
+        Returns:
+            The created reasoning steps
+        """
+        start = len(self.steps) + 1
+        new_steps = [
+            ReasoningStep(
+                step_number=step_number,
+                premise=step['premise'],
+                conclusion=step['conclusion'],
+                rule_applied=step['rule'],
+                truth_value=step.get('truth_value'),
+                evidence=tuple(step.get('evidence') or ()),
+                confidence_level=_step_confidence_level(step.get('truth_value'))
+            )
+            for step_number, step in enumerate(steps, start)
+        ]
+        
+        self.steps.extend(new_steps)
+        self._premises.extend(step.premise for step in new_steps)
+        self.overall_confidence = None
+        logger.debug("Added reasoning steps %s-%s", start, len(self.steps))
+        
+        return new_steps
+    
     def calculate_confidence(self) -> Dict[str, Any]:
         """
         Calculate overall confidence of the reasoning chain
@@ -107,9 +148,21 @@ class ReasoningChain:
         Returns:
             Confidence score details
         """
-        chain_data = [step.to_dict() for step in self.steps]
-        confidence = self.confidence_scorer.score_reasoning_chain(chain_data)
+        # Chains only grow, so a score for the current length is still valid
+        if self.overall_confidence is not None and self._confidence_steps == len(self.steps):
+            return self.overall_confidence.to_dict()
+        
+        if not self.steps:
+            confidence = self.confidence_scorer.score_reasoning_chain([])
+        else:
+            confidences = np.fromiter(
+                (step.truth_value.confidence if step.truth_value else 0.5 for step in self.steps),
+                dtype=np.float64, count=len(self.steps)
+            )
+            evidence_count = sum(1 for step in self.steps if step.evidence)
+            confidence = self.confidence_scorer.score_confidences(confidences, evidence_count)
         self.overall_confidence = confidence
+        self._confidence_steps = len(self.steps)
         return confidence.to_dict()
     
     def get_chain_summary(self) -> Dict[str, Any]:
@@ -119,15 +172,20 @@ class ReasoningChain:
         Returns:
             Summary with key information
         """
-        if not self.overall_confidence:
-            self.calculate_confidence()
+        # Reuses the stored score while the chain is unchanged
+        confidence = self.calculate_confidence()
+        
+        # The path only changes when steps are added
+        if self._path_steps != len(self._premises):
+            self._path = ' → '.join(self._premises + [self.goal])
+            self._path_steps = len(self._premises)
         
         return {
             'goal': self.goal,
             'total_steps': len(self.steps),
-            'confidence': self.overall_confidence.to_dict() if self.overall_confidence else None,
+            'confidence': confidence,
             'steps': [step.to_dict() for step in self.steps],
-            'path': ' → '.join([step.premise for step in self.steps] + [self.goal])
+            'path': self._path
         }
     
     def to_text_explanation(self) -> str:
@@ -137,25 +195,17 @@ class ReasoningChain:
         Returns:
             Text explanation of the reasoning
         """
-        lines = [f"**Reasoning Chain: {self.goal}**\n"]
-        
+        buf = io.StringIO()
+        write = buf.write
+        write(f"**Reasoning Chain: {self.goal}**\n")
         for step in self.steps:
-            lines.append(f"**Step {step.step_number}:** {step.premise}")
-            lines.append(f"  ↓ (using: {step.rule_applied})")
-            lines.append(f"  → {step.conclusion}")
-            
-            if step.truth_value:
-                lines.append(f"  Confidence: {step.truth_value.confidence:.2f}")
-            
-            if step.evidence:
-                lines.append(f"  Evidence: {', '.join(step.evidence)}")
-            
-            lines.append("")  # Blank line
+            write("\n")
+            write(_format_step_text(step))
         
         if self.overall_confidence:
-            lines.append(f"**Overall Confidence:** {self.overall_confidence.level} ({self.overall_confidence.overall_score:.2f})")
+            write(f"\n**Overall Confidence:** {self.overall_confidence.level} ({self.overall_confidence.overall_score:.2f})")
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
     def to_graph_data(self) -> Dict[str, Any]:
         """
@@ -164,50 +214,51 @@ class ReasoningChain:
         Returns:
             Graph data with nodes and edges
         """
-        nodes = []
-        edges = []
+        steps = self.steps
+        n = len(steps)
+        nodes = [None] * (n + 2)
+        edges = [None] * (n + 1)
         
         # Add start node
-        nodes.append({
+        nodes[0] = {
             'id': 'start',
             'label': 'Start',
             'type': 'start'
-        })
+        }
         
-        # Add step nodes
+        # Add step nodes, each linked from the previous node
         prev_id = 'start'
-        for step in self.steps:
+        for i, step in enumerate(steps, 1):
             node_id = f"step_{step.step_number}"
+            rule = step.rule_applied
+            truth_value = step.truth_value
             
-            nodes.append({
+            nodes[i] = {
                 'id': node_id,
                 'label': step.conclusion,
                 'type': 'step',
                 'confidence': step.confidence_level,
-                'rule': step.rule_applied
-            })
-            
-            edges.append({
+                'rule': rule
+            }
+            edges[i - 1] = {
                 'from': prev_id,
                 'to': node_id,
-                'label': step.rule_applied,
-                'confidence': step.truth_value.confidence if step.truth_value else 0.5
-            })
-            
+                'label': rule,
+                'confidence': truth_value.confidence if truth_value else 0.5
+            }
             prev_id = node_id
         
         # Add goal node
-        nodes.append({
+        nodes[-1] = {
             'id': 'goal',
             'label': self.goal,
             'type': 'goal'
-        })
-        
-        edges.append({
+        }
+        edges[-1] = {
             'from': prev_id,
             'to': 'goal',
             'label': 'conclusion'
-        })
+        }
         
         return {
             'nodes': nodes,
@@ -219,6 +270,28 @@ class ReasoningChain:
         }
 
 
+def _format_step_text(step: ReasoningStep) -> str:
+    """Render one step of a text explanation, ending with a blank line"""
+    extras = ""
+    if step.truth_value:
+        extras += f"\n  Confidence: {step.truth_value.confidence:.2f}"
+    if step.evidence:
+        extras += f"\n  Evidence: {', '.join(step.evidence)}"
+    text = _STEP_TEXT.format(step=step.step_number, premise=step.premise,
+                             rule=step.rule_applied, conclusion=step.conclusion)
+    return text + extras + "\n"
+
+
+def _step_confidence_level(truth_value: Optional[TruthValue]) -> str:
+    """Bucket a step's truth value confidence into high/medium/low"""
+    if not truth_value:
+        return "medium"
+    confidence = truth_value.confidence
+    return ("high" if confidence >= HIGH_CONFIDENCE_STEP
+            else "medium" if confidence >= MEDIUM_CONFIDENCE_STEP
+            else "low")
+
+
 class ReasoningChainBuilder:
     """
     Helper class to build reasoning chains
@@ -241,50 +314,39 @@ class ReasoningChainBuilder:
         self.current_chain = ReasoningChain(goal)
         return self.current_chain
     
-    def add_deduction(self, premise: str, conclusion: str, 
-                     truth_value: TruthValue,
-                     evidence: Optional[List[str]] = None) -> ReasoningStep:
-        """Add a deduction step"""
-        if not self.current_chain:
+    def _add(self, rule: str, premise: str, conclusion: str,
+             truth_value: TruthValue,
+             evidence: Optional[List[str]] = None) -> ReasoningStep:
+        """Add a step applying the given rule to the current chain"""
+        chain = self.current_chain
+        if chain is None:
             raise ValueError("No active chain. Call start_chain() first.")
         
-        return self.current_chain.add_step(
+        return chain.add_step(
             premise=premise,
             conclusion=conclusion,
-            rule="Deduction",
+            rule=rule,
             truth_value=truth_value,
             evidence=evidence
         )
     
+    def add_deduction(self, premise: str, conclusion: str, 
+                     truth_value: TruthValue,
+                     evidence: Optional[List[str]] = None) -> ReasoningStep:
+        """Add a deduction step"""
+        return self._add("Deduction", premise, conclusion, truth_value, evidence)
+    
     def add_abduction(self, observation: str, hypothesis: str,
                      truth_value: TruthValue,
                      evidence: Optional[List[str]] = None) -> ReasoningStep:
         """Add an abduction step (hypothesis generation)"""
-        if not self.current_chain:
-            raise ValueError("No active chain. Call start_chain() first.")
-        
-        return self.current_chain.add_step(
-            premise=observation,
-            conclusion=hypothesis,
-            rule="Abduction",
-            truth_value=truth_value,
-            evidence=evidence
-        )
+        return self._add("Abduction", observation, hypothesis, truth_value, evidence)
     
     def add_induction(self, instances: str, generalization: str,
                      truth_value: TruthValue,
                      evidence: Optional[List[str]] = None) -> ReasoningStep:
         """Add an induction step (generalization from instances)"""
-        if not self.current_chain:
-            raise ValueError("No active chain. Call start_chain() first.")
-        
-        return self.current_chain.add_step(
-            premise=instances,
-            conclusion=generalization,
-            rule="Induction",
-            truth_value=truth_value,
-            evidence=evidence
-        )
+        return self._add("Induction", instances, generalization, truth_value, evidence)
     
     def finalize(self) -> Dict[str, Any]:
         """
@@ -301,18 +363,19 @@ class ReasoningChainBuilder:
         return summary
 
 
-# Singleton instance
-_chain_builder_instance = None
+# One builder per thread: a builder tracks a single current chain, so
+# concurrent requests must not share one
+_chain_builders = threading.local()
 
 
 def get_chain_builder() -> ReasoningChainBuilder:
     """
-    Get singleton chain builder instance
+    Get the calling thread's chain builder instance
     
     Returns:
         ReasoningChainBuilder instance
     """
-    global _chain_builder_instance
-    if _chain_builder_instance is None:
-        _chain_builder_instance = ReasoningChainBuilder()
-    return _chain_builder_instance
+    builder = getattr(_chain_builders, 'builder', None)
+    if builder is None:
+        builder = _chain_builders.builder = ReasoningChainBuilder()
+    return builder
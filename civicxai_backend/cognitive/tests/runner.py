@@ -0,0 +1,73 @@
+"""
+Parallel runner for the phase test suites
+Runs independent tests on a thread pool and prints their output in order
+"""
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+
+
+class _ThreadRoutedStdout(io.TextIOBase):
+    """Sends writes to the calling thread's buffer, or to the real stdout"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def run_tests(tests, serial=()):
+    """
+    Run test methods and print each one's output in list order
+
+    Args:
+        tests: Test callables in display order
+        serial: Tests that share mutable state (e.g. the AtomSpace); these
+            run one at a time on the calling thread after the parallel batch
+
+    Returns:
+        List of test results in the same order as tests
+    """
+    serial = set(serial)
+    outputs = [None] * len(tests)
+    results = [None] * len(tests)
+    router = _ThreadRoutedStdout(sys.stdout)
+
+    def run(index):
+        router.local.buffer = buffer = io.StringIO()
+        try:
+            results[index] = tests[index]()
+        finally:
+            router.local.buffer = None
+            outputs[index] = buffer.getvalue()
+
+    def run_in_worker(index):
+        try:
+            run(index)
+        finally:
+            connections.close_all()
+
+    parallel = [i for i, test in enumerate(tests) if test not in serial]
+    sys.stdout = router
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(run_in_worker, parallel))
+        for i, test in enumerate(tests):
+            if test in serial:
+                run(i)
+    finally:
+        sys.stdout = router.stream
+
+    for output in outputs:
+        print(output)  # Blank line between tests
+    return results
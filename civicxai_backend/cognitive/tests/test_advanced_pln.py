@@ -0,0 +1,120 @@
+"""
+Tests for the advanced PLN engine
+Forward chaining depths, the generated chainer and case similarity
+"""
+import pytest
+
+from cognitive.pln.advanced_pln import AdvancedPLNEngine
+from cognitive.pln.pln_rules import PLNRulesEngine, TruthValue
+
+
+@pytest.fixture
+def engine():
+    """Engine over its own ruleset, so added rules don't leak into other tests"""
+    engine = AdvancedPLNEngine()
+    engine.pln_engine = PLNRulesEngine()
+    engine.pln_engine.add_rule('a_to_b', 'A', 'B', TruthValue(0.9, 0.9))
+    engine.pln_engine.add_rule('b_to_c', 'B', 'C', TruthValue(0.9, 0.9))
+    return engine
+
+
+# ===== Forward chaining =====
+
+def test_forward_chaining_depth_is_chain_length(engine):
+    """Each conclusion fires rules one step later, so depth counts rule applications"""
+    results = engine.forward_chaining([('A', TruthValue(1.0, 1.0))])
+    depths = {r.conclusion: r.depth for r in results}
+    assert depths == {'B': 1, 'C': 2}
+
+
+def test_forward_chaining_max_steps_bounds_chain_length(engine):
+    """A conclusion doesn't fire rules within its own step"""
+    results = engine.forward_chaining([('A', TruthValue(1.0, 1.0))], max_steps=1)
+    assert [r.conclusion for r in results] == ['B']
+
+
+def test_forward_chaining_truth_values(engine):
+    """Conclusions carry the deduced truth value of their chain"""
+    results = engine.forward_chaining([('A', TruthValue(1.0, 1.0))])
+    tv = {r.conclusion: r.truth_value for r in results}['C']
+    assert tv.strength == pytest.approx(0.81)
+    assert tv.confidence == pytest.approx(0.9 * 0.9 * 0.9)
+
+
+def test_forward_chaining_prunes_weak_conclusions(engine):
+    """Conclusions below the cutoffs are neither added nor chained further"""
+    results = engine.forward_chaining([('A', TruthValue(1.0, 1.0))], min_strength=0.85)
+    assert [r.conclusion for r in results] == ['B']
+
+
+def test_forward_chaining_skips_known_facts(engine):
+    """Rules don't fire for conclusions already in the working set"""
+    results = engine.forward_chaining([('A', TruthValue(1.0, 1.0)),
+                                       ('B', TruthValue(0.5, 0.5))])
+    assert [r.conclusion for r in results] == ['C']
+    assert results[0].truth_value.strength == pytest.approx(0.45)
+
+
+# ===== Generated forward chainer =====
+
+def test_forward_chainer_has_step_per_condition(engine):
+    """Each rule condition gets a step function"""
+    step_functions = engine.pln_engine.compile_forward_chainer()
+    assert {'A', 'B', 'High_Poverty_Region'} <= set(step_functions)
+
+
+def test_forward_chainer_step_applies_rules(engine):
+    """A step adds each new conclusion with its deduced truth value and records the firing"""
+    working_set = {'A': TruthValue(1.0, 1.0)}
+    fired = []
+    engine.pln_engine.compile_forward_chainer()['A'](working_set, fired, 0.0, 0.0)
+
+    assert fired == [('a_to_b', 'A', 'B')]
+    assert working_set['B'].strength == pytest.approx(0.9)
+    assert working_set['B'].confidence == pytest.approx(0.81)
+
+
+def test_forward_chainer_step_keeps_known_and_weak_conclusions_out(engine):
+    """Known conclusions aren't overwritten and weak ones aren't added"""
+    known = TruthValue(0.2, 0.2)
+    working_set = {'A': TruthValue(1.0, 1.0), 'B': known}
+    fired = []
+    step_functions = engine.pln_engine.compile_forward_chainer()
+    step_functions['A'](working_set, fired, 0.0, 0.0)
+    assert working_set['B'] is known
+
+    working_set = {'B': TruthValue(0.5, 1.0)}
+    step_functions['B'](working_set, fired, 0.5, 0.0)
+    assert 'C' not in working_set
+    assert fired == []
+
+
+def test_forward_chainer_recompiles_after_rule_change(engine):
+    """The compiled chainer is reused until the ruleset changes"""
+    pln = engine.pln_engine
+    compiled = pln.compile_forward_chainer()
+    assert pln.compile_forward_chainer() is compiled
+
+    pln.add_rule('quoted', "it's \"odd\"", 'D', TruthValue(0.9, 0.9))
+    recompiled = pln.compile_forward_chainer()
+    assert recompiled is not compiled
+
+    working_set = {"it's \"odd\"": TruthValue(1.0, 1.0)}
+    fired = []
+    recompiled["it's \"odd\""](working_set, fired, 0.0, 0.0)
+    assert fired == [('quoted', "it's \"odd\"", 'D')]
+
+
+# ===== Case similarity =====
+
+def test_case_similarity_numeric_and_exact(engine):
+    """Numbers score by relative distance, other values by equality"""
+    case1 = {'poverty': 0.5, 'region': 'north', 'only_here': 1}
+    case2 = {'poverty': 1.0, 'region': 'north'}
+    assert engine._calculate_similarity(case1, case2) == pytest.approx(0.75)
+
+
+def test_case_similarity_unhashable_values(engine):
+    """Unhashable values are compared as they are rather than by a stand-in"""
+    assert engine._calculate_similarity({'tags': ['a', 'b']}, {'tags': ['a', 'b']}) == 1.0
+    assert engine._calculate_similarity({'tags': ['a', 'b']}, {'tags': ['a', 'c']}) == 0.0
@@ -4,6 +4,8 @@ Tests PDF processing, concept extraction, and atom generation
 """
 import sys
 import os
+import threading
+from functools import cached_property
 from pathlib import Path
 
 # Add parent directory to path
@@ -18,17 +20,34 @@ from cognitive.processors.pdf_processor import get_pdf_processor
 from cognitive.processors.concept_extractor import get_concept_extractor
 from cognitive.atoms.atom_generator import AtomGenerator, get_atom_generator
 from cognitive.pipline.ingestion_pipeline import get_ingestion_pipeline
+from cognitive.tests.runner import run_tests
 
 
 class TestIngestionPipeline:
     """Test knowledge ingestion pipeline"""
     
     def __init__(self):
-        self.pdf_processor = get_pdf_processor()
-        self.concept_extractor = get_concept_extractor()
-        self.atom_generator = get_atom_generator()
-        self.pipeline = get_ingestion_pipeline()
-        self.test_results = []
+        self.passed = 0
+        self.total = 0
+        self._lock = threading.Lock()
+    
+    # Services load on first use, so tests that don't need spaCy skip it
+    
+    @cached_property
+    def pdf_processor(self):
+        return get_pdf_processor()
+    
+    @cached_property
+    def concept_extractor(self):
+        return get_concept_extractor()
+    
+    @cached_property
+    def atom_generator(self):
+        return get_atom_generator()
+    
+    @cached_property
+    def pipeline(self):
+        return get_ingestion_pipeline()
     
     def log_test(self, test_name, passed, message=""):
         """Log test result"""
@@ -36,7 +55,9 @@ class TestIngestionPipeline:
         print(f"{status} - {test_name}")
         if message:
             print(f"    {message}")
-        self.test_results.append((test_name, passed))
+        with self._lock:
+            self.total += 1
+            self.passed += bool(passed)
     
     def test_pdf_processor_initialization(self):
         """Test 1: PDF processor initialization"""
@@ -313,13 +334,19 @@ class TestIngestionPipeline:
             self.test_pipeline_initialization,
         ]
         
-        for test in tests:
-            test()
-            print()  # Blank line between tests
+        # These share the AtomSpace, so they run one at a time
+        serial = [
+            self.test_atom_generation,
+            self.test_domain_knowledge_initialization,
+            self.test_process_text,
+            self.test_pipeline_initialization,
+        ]
+        
+        run_tests(tests, serial)
         
         # Summary
-        passed = sum(1 for _, result in self.test_results if result)
-        total = len(self.test_results)
+        passed = self.passed
+        total = self.total
         
         print("="*60)
         print(f"📊 TEST SUMMARY: {passed}/{total} tests passed")
@@ -0,0 +1,96 @@
+"""
+Tests for the PDF processor's section splitting and scanned page detection
+"""
+import pytest
+from pypdf import PageObject
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from cognitive.processors.pdf_processor import PDFProcessor, _can_hold_text
+
+
+# ===== Sections =====
+
+@pytest.fixture
+def processor():
+    return PDFProcessor()
+
+
+def test_extract_sections_splits_on_headings(processor):
+    """Caps, colon and numbered headings start sections; leading text is the introduction"""
+    text = (
+        "Preamble line\n\n"
+        "BACKGROUND\n"
+        "   Poverty is high.  \n"
+        "More text.\n"
+        "1. Methods\n"
+        "We surveyed.\n"
+        "Findings:\n"
+        "Results here."
+    )
+    assert processor.extract_sections(text) == [
+        {'title': 'Introduction', 'content': 'Preamble line'},
+        {'title': 'BACKGROUND', 'content': 'Poverty is high.\nMore text.'},
+        {'title': '1. Methods', 'content': 'We surveyed.'},
+        {'title': 'Findings', 'content': 'Results here.'},
+    ]
+
+
+def test_extract_sections_drops_empty_sections(processor):
+    """Headings with no content before the next heading add no section"""
+    text = "SUMMARY\nOVERVIEW\nBody text.\nCONCLUSION"
+    assert processor.extract_sections(text) == [
+        {'title': 'OVERVIEW', 'content': 'Body text.'},
+    ]
+
+
+def test_extract_sections_keeps_heading_candidates_that_are_not_headings(processor):
+    """Lines that only look like headings stay in the content"""
+    text = "INTRO\n2024 was a year of growth\nA-1\nend"
+    assert processor.extract_sections(text) == [
+        {'title': 'INTRO', 'content': '2024 was a year of growth\nA-1\nend'},
+    ]
+
+
+# ===== Scanned pages =====
+
+def page_with_resources(resources=None):
+    """Blank page, optionally with a /Resources dictionary"""
+    page = PageObject.create_blank_page(width=100, height=100)
+    if resources is not None:
+        page[NameObject('/Resources')] = DictionaryObject(resources)
+    return page
+
+
+def xobject(subtype):
+    """XObject stream of the given subtype"""
+    stream = DecodedStreamObject()
+    stream[NameObject('/Subtype')] = NameObject(subtype)
+    return stream
+
+
+def test_page_with_font_can_hold_text():
+    """Fonts in the page resources mean text may be drawn"""
+    page = page_with_resources({NameObject('/Font'): DictionaryObject()})
+    assert _can_hold_text(page)
+
+
+def test_page_with_form_xobject_can_hold_text():
+    """A form XObject can draw text with its own fonts"""
+    page = page_with_resources({NameObject('/XObject'): DictionaryObject({
+        NameObject('/Im0'): xobject('/Image'),
+        NameObject('/Fm0'): xobject('/Form'),
+    })})
+    assert _can_hold_text(page)
+
+
+def test_image_only_page_cannot_hold_text():
+    """A page drawing only images is a scan"""
+    page = page_with_resources({NameObject('/XObject'): DictionaryObject({
+        NameObject('/Im0'): xobject('/Image'),
+    })})
+    assert not _can_hold_text(page)
+
+
+def test_page_without_resources_cannot_hold_text():
+    """A page with no resources has nothing to draw text with"""
+    assert not _can_hold_text(page_with_resources())
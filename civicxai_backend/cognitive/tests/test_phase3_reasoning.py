@@ -4,6 +4,7 @@ Tests PLN rules, confidence scoring, and reasoning chains
 """
 import sys
 import os
+import threading
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -17,6 +18,7 @@ from cognitive.pln.pln_rules import get_pln_engine, TruthValue
 from cognitive.pipline.confidence_scorer import get_confidence_scorer
 from cognitive.reasoner.reasoning_chain import get_chain_builder
 from cognitive.reasoner.reasoner import get_reasoner
+from cognitive.tests.runner import run_tests
 
 
 class TestPhase3Reasoning:
@@ -25,9 +27,15 @@ class TestPhase3Reasoning:
     def __init__(self):
         self.pln_engine = get_pln_engine()
         self.confidence_scorer = get_confidence_scorer()
-        self.chain_builder = get_chain_builder()
         self.reasoner = get_reasoner()
-        self.test_results = []
+        self.passed = 0
+        self.total = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def chain_builder(self):
+        # Builders are per thread, so parallel chain tests don't share one
+        return get_chain_builder()
     
     def log_test(self, test_name, passed, message=""):
         """Log test result"""
@@ -35,7 +43,9 @@ class TestPhase3Reasoning:
         print(f"{status} - {test_name}")
         if message:
             print(f"    {message}")
-        self.test_results.append((test_name, passed))
+        with self._lock:
+            self.total += 1
+            self.passed += bool(passed)
     
     def test_pln_engine_initialization(self):
         """Test 1: PLN engine initialization"""
@@ -275,13 +285,17 @@ class TestPhase3Reasoning:
             self.test_pln_reasoning_integration,
         ]
         
-        for test in tests:
-            test()
-            print()  # Blank line between tests
+        # These share the AtomSpace, so they run one at a time
+        serial = [
+            self.test_enhanced_reasoner_stats,
+            self.test_pln_reasoning_integration,
+        ]
+        
+        run_tests(tests, serial)
         
         # Summary
-        passed = sum(1 for _, result in self.test_results if result)
-        total = len(self.test_results)
+        passed = self.passed
+        total = self.total
         
         print("="*60)
         print(f"📊 TEST SUMMARY: {passed}/{total} tests passed")
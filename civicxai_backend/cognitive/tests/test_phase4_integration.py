@@ -13,7 +13,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'civicxai_backend.settings')
 import django
 django.setup()
 
-from cognitive.orchestrator.orchestrator import get_orchestrator, QueryComplexity, RoutingDecision
+from cognitive.orchestrator.orchestrator import (
+    get_orchestrator, QueryComplexity, RoutingDecision,
+    FLAG_CALCULATION, FLAG_COMPARISON, FLAG_DOCUMENTS, FLAG_EXPLANATION
+)
 from cognitive.core.hybrid_responder import get_hybrid_responder
 from cognitive.knowledge.knowledge_store import get_knowledge_store
 
@@ -25,7 +28,8 @@ class TestPhase4Integration:
         self.orchestrator = get_orchestrator()
         self.hybrid_responder = get_hybrid_responder()
         self.knowledge = get_knowledge_store()
-        self.test_results = []
+        self.passed = 0
+        self.total = 0
     
     def log_test(self, test_name, passed, message=""):
         """Log test result"""
@@ -33,7 +37,8 @@ class TestPhase4Integration:
         print(f"{status} - {test_name}")
         if message:
             print(f"    {message}")
-        self.test_results.append((test_name, passed))
+        self.total += 1
+        self.passed += bool(passed)
     
     def test_orchestrator_initialization(self):
         """Test 1: Orchestrator initialization"""
@@ -52,12 +57,12 @@ class TestPhase4Integration:
             analysis = self.orchestrator.analyze_query(query)
             
             passed = (
-                analysis['complexity'] == QueryComplexity.SIMPLE and
-                analysis['requires_calculation']
+                analysis.complexity == QueryComplexity.SIMPLE and
+                bool(analysis.flags & FLAG_CALCULATION)
             )
             
             self.log_test("Simple Query Analysis", passed,
-                         f"Complexity: {analysis['complexity'].name}")
+                         f"Complexity: {analysis.complexity.name}")
             return passed
         except Exception as e:
             self.log_test("Simple Query Analysis", False, str(e))
@@ -69,10 +74,10 @@ class TestPhase4Integration:
             query = "What documents mention poverty?"
             analysis = self.orchestrator.analyze_query(query)
             
-            passed = analysis['requires_documents']
+            passed = bool(analysis.flags & FLAG_DOCUMENTS)
             
             self.log_test("Document Query Detection", passed,
-                         f"Intent: {analysis['intent']}, Keywords: {analysis['keywords']}")
+                         f"Intent: {analysis.intent}, Keywords: {analysis.keywords}")
             return passed
         except Exception as e:
             self.log_test("Document Query Detection", False, str(e))
@@ -85,12 +90,12 @@ class TestPhase4Integration:
             analysis = self.orchestrator.analyze_query(query)
             
             passed = (
-                analysis['complexity'] in [QueryComplexity.COMPLEX, QueryComplexity.VERY_COMPLEX] and
-                analysis['requires_explanation']
+                analysis.complexity in [QueryComplexity.COMPLEX, QueryComplexity.VERY_COMPLEX] and
+                bool(analysis.flags & FLAG_EXPLANATION)
             )
             
             self.log_test("Complex Query Analysis", passed,
-                         f"Complexity: {analysis['complexity'].name}")
+                         f"Complexity: {analysis.complexity.name}")
             return passed
         except Exception as e:
             self.log_test("Complex Query Analysis", False, str(e))
@@ -102,10 +107,10 @@ class TestPhase4Integration:
             query = "What documents mention poverty and allocation?"
             routing_decision = self.orchestrator.route_query(query)
             
-            passed = routing_decision['routing'] == RoutingDecision.COGNITIVE
+            passed = routing_decision.routing == RoutingDecision.COGNITIVE
             
             self.log_test("Routing to Cognitive", passed,
-                         f"Routed to: {routing_decision['routing'].value}")
+                         f"Routed to: {routing_decision.routing.value}")
             return passed
         except Exception as e:
             self.log_test("Routing to Cognitive", False, str(e))
@@ -118,10 +123,10 @@ class TestPhase4Integration:
             routing_decision = self.orchestrator.route_query(query)
             
             # Should route to MeTTa or Hybrid MeTTa
-            passed = routing_decision['routing'] in [RoutingDecision.METTA, RoutingDecision.HYBRID_METTA]
+            passed = routing_decision.routing in [RoutingDecision.METTA, RoutingDecision.HYBRID_METTA]
             
             self.log_test("Routing to MeTTa", passed,
-                         f"Routed to: {routing_decision['routing'].value}")
+                         f"Routed to: {routing_decision.routing.value}")
             return passed
         except Exception as e:
             self.log_test("Routing to MeTTa", False, str(e))
@@ -133,7 +138,7 @@ class TestPhase4Integration:
             query = "Find documents about poverty and deforestation in rural areas"
             analysis = self.orchestrator.analyze_query(query)
             
-            keywords = analysis['keywords']
+            keywords = analysis.keywords
             passed = len(keywords) > 0 and 'poverty' in [k.lower() for k in keywords]
             
             self.log_test("Keyword Extraction", passed,
@@ -156,7 +161,7 @@ class TestPhase4Integration:
             all_correct = True
             for query, expected_intent in queries_and_intents:
                 analysis = self.orchestrator.analyze_query(query)
-                if analysis['intent'] != expected_intent:
+                if analysis.intent != expected_intent:
                     all_correct = False
                     break
             
@@ -197,9 +202,9 @@ class TestPhase4Integration:
             analysis = self.orchestrator.analyze_query(query)
             
             requirement_count = sum([
-                analysis['requires_explanation'],
-                analysis['requires_comparison'],
-                analysis['requires_documents']
+                bool(analysis.flags & FLAG_EXPLANATION),
+                bool(analysis.flags & FLAG_COMPARISON),
+                bool(analysis.flags & FLAG_DOCUMENTS)
             ])
             
             passed = requirement_count >= 2
@@ -217,7 +222,7 @@ class TestPhase4Integration:
             query = "What documents mention poverty?"
             routing_decision = self.orchestrator.route_query(query)
             
-            rationale = routing_decision['rationale']
+            rationale = routing_decision.rationale
             passed = len(rationale) > 0 and 'document' in rationale.lower()
             
             self.log_test("Routing Rationale", passed,
@@ -253,8 +258,8 @@ class TestPhase4Integration:
             print()  # Blank line between tests
         
         # Summary
-        passed = sum(1 for _, result in self.test_results if result)
-        total = len(self.test_results)
+        passed = self.passed
+        total = self.total
         
         print("="*60)
         print(f"📊 TEST SUMMARY: {passed}/{total} tests passed")
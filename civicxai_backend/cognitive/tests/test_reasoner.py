@@ -0,0 +1,117 @@
+"""
+Tests for the cognitive reasoner: region criteria queries and causal chains
+"""
+import uuid
+
+import pytest
+
+from cognitive.knowledge.knowledge_store import get_knowledge_store
+from cognitive.reasoner.reasoner import _criteria_query, get_reasoner
+
+
+@pytest.fixture(scope="session")
+def knowledge():
+    return get_knowledge_store()
+
+
+@pytest.fixture(scope="session")
+def reasoner():
+    return get_reasoner()
+
+
+def unique(name: str) -> str:
+    """Name that no other test uses, so tests don't share atoms"""
+    return f"{name}_{uuid.uuid4().hex}"
+
+
+# ===== Region criteria queries =====
+
+def test_criteria_query_single_comparison():
+    """A comparison prefix becomes a MeTTa test on the property's value"""
+    assert _criteria_query({'poverty_index': '>0.7'}) == (
+        '!(match &self (, (InheritanceLink $r Region) '
+        '(EvaluationLink (PredicateNode "poverty_index") (ListLink $r $v0))) '
+        '(if (> $v0 0.7) $r (empty)))'
+    )
+
+
+@pytest.mark.parametrize("spec, test", [
+    ('>=0.5', '(>= $v0 0.5)'),
+    ('< 3', '(< $v0 3.0)'),
+    ('<=3', '(<= $v0 3.0)'),
+    ('==1', '(== $v0 1.0)'),
+    ('=urban', '(== $v0 "urban")'),
+    ('urban', '(== $v0 "urban")'),
+    (5, '(== $v0 5)'),
+    (True, '(== $v0 True)'),
+])
+def test_criteria_query_operators(spec, test):
+    """Operators parse from the spec; plain values match for equality"""
+    assert f'(if {test} $r (empty))' in _criteria_query({'p': spec})
+
+
+def test_criteria_query_nests_binary_and():
+    """Criteria are sorted by name and joined with right-nested binary ands"""
+    query = _criteria_query({'c': 5, 'a': '=urban', 'b': '<=3'})
+    assert '(PredicateNode "a") (ListLink $r $v0)' in query
+    assert '(PredicateNode "b") (ListLink $r $v1)' in query
+    assert '(PredicateNode "c") (ListLink $r $v2)' in query
+    assert query.endswith(
+        '(if (and (== $v0 "urban") (and (<= $v1 3.0) (== $v2 5))) $r (empty)))'
+    )
+
+
+def test_criteria_query_escapes_names_and_values():
+    """Quotes in names and values can't close the MeTTa string early"""
+    query = _criteria_query({'x") (Evil': '=a"b\\'})
+    assert '(PredicateNode "x\\") (Evil")' in query
+    assert '(== $v0 "a\\"b\\\\")' in query
+
+
+# ===== Causal chains =====
+
+def add_causes(knowledge, *links):
+    """Add (cause, effect) CausalLinks"""
+    for cause, effect in links:
+        knowledge.add_causal_relationship(cause, effect)
+
+
+def test_causal_chain_max_hops_boundary(knowledge, reasoner):
+    """A chain of exactly max_hops links is found; one link fewer allowed is not"""
+    start, middle, end = unique('Start'), unique('Middle'), unique('End')
+    add_causes(knowledge, (start, middle), (middle, end))
+
+    assert reasoner.infer_causal_chain(start, end, max_hops=2) == [[start, middle, end]]
+    assert reasoner.infer_causal_chain(start, end, max_hops=1) == []
+
+
+def test_causal_chain_revisits_concept_reached_by_shorter_path(knowledge, reasoner):
+    """A concept first reached too deep to extend is expanded again from a shorter path"""
+    # The goal-named branch is searched first and reaches shared at depth 3,
+    # where max_hops=4 leaves no room for shared -> near -> goal
+    goal = unique('goal')
+    start, via_goal, detour = unique('start'), unique('goal_via'), unique('detour')
+    direct, shared, near = unique('direct'), unique('shared'), unique('near')
+    add_causes(knowledge, (start, via_goal), (via_goal, detour), (detour, shared),
+               (start, direct), (direct, shared), (shared, near), (near, goal))
+
+    assert reasoner.infer_causal_chain(start, goal, max_hops=4) == [
+        [start, direct, shared, near, goal]
+    ]
+
+
+def test_causal_chain_cycle_terminates(knowledge, reasoner):
+    """Cycles are not followed forever when the end is unreachable"""
+    a, b, end = unique('CycleA'), unique('CycleB'), unique('Unreachable')
+    add_causes(knowledge, (a, b), (b, a))
+
+    assert reasoner.infer_causal_chain(a, end, max_hops=10) == []
+
+
+def test_causal_chain_start_is_end(knowledge, reasoner):
+    """A concept only reaches itself through a causal cycle"""
+    concept, other = unique('Loop'), unique('LoopBack')
+    assert reasoner.infer_causal_chain(concept, concept) == []
+
+    add_causes(knowledge, (concept, other), (other, concept))
+    assert reasoner.infer_causal_chain(concept, concept) == [[concept, other, concept]]
@@ -320,13 +320,11 @@ class IngestPDFView(APIView):
             uploaded_file = request.FILES['file']
             source_id = request.data.get('source_id', f"Source_{uploaded_file.name}")
             
-            # Read file bytes
-            pdf_bytes = uploaded_file.read()
-            
-            # Process PDF
+            # Process PDF straight from the upload's file object, which large
+            # uploads spool to disk, instead of reading it all into memory
             from .pipline.ingestion_pipeline import get_ingestion_pipeline
             pipeline = get_ingestion_pipeline()
-            result = pipeline.process_pdf_bytes(pdf_bytes, uploaded_file.name, source_id)
+            result = pipeline.process_pdf_bytes(uploaded_file.file, uploaded_file.name, source_id)
             
             if result['success']:
                 return Response(result, status=status.HTTP_201_CREATED)
@@ -258,9 +258,9 @@ class DataSourceAdmin(admin.ModelAdmin):
     
     list_display = [
         'title', 'source_type', 'category', 'is_active', 
-        'usage_count', 'added_by', 'created_at'
+        'processing_status', 'usage_count', 'added_by', 'created_at'
     ]
-    list_filter = ['source_type', 'category', 'is_active', 'created_at']
+    list_filter = ['source_type', 'category', 'is_active', 'processing_status', 'created_at']
     search_fields = ['title', 'description', 'tags', 'author', 'summary']
     ordering = ['-created_at']
     date_hierarchy = 'created_at'
@@ -283,11 +283,14 @@ class DataSourceAdmin(admin.ModelAdmin):
             'fields': ('usage_count', 'last_used', 'added_by'),
             'classes': ('collapse',)
         }),
+        ('Knowledge Ingestion', {
+            'fields': ('processing_status',)
+        }),
     )
     
-    readonly_fields = ['usage_count', 'last_used', 'added_by']
+    readonly_fields = ['usage_count', 'last_used', 'added_by', 'processing_status']
     
-    actions = ['activate_sources', 'deactivate_sources', 'reset_usage_count']
+    actions = ['activate_sources', 'deactivate_sources', 'reset_usage_count', 'reprocess_sources']
     
     def activate_sources(self, request, queryset):
         count = queryset.update(is_active=True)
@@ -304,6 +307,15 @@ class DataSourceAdmin(admin.ModelAdmin):
         self.message_user(request, f"Reset usage count for {count} source(s).")
     reset_usage_count.short_description = "Reset usage counters"
     
+    def reprocess_sources(self, request, queryset):
+        # Lazy import: the cognitive app pulls in the ingestion stack
+        from cognitive.core.signals import queue_data_sources
+        ids = list(queryset.filter(is_active=True).values_list('id', flat=True))
+        queryset.filter(id__in=ids).update(processing_status='pending')
+        queue_data_sources(ids)
+        self.message_user(request, f"Queued {len(ids)} data source(s) for ingestion.")
+    reprocess_sources.short_description = "Re-ingest selected sources"
+    
     def save_model(self, request, obj, form, change):
         if not change:  # If creating a new object
             obj.added_by = request.user
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from explainable_ai.models import DataSource
+
+
+class Command(BaseCommand):
+    help = 'Ingest active data sources that were never ingested or whose ingestion failed'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all', action='store_true',
+            help='Re-ingest every active data source, including ingested ones'
+        )
+    
+    def handle(self, *args, **options):
+        # Lazy import: the cognitive app pulls in the ingestion stack
+        from cognitive.core.signals import process_data_source_task
+        
+        sources = DataSource.objects.filter(is_active=True)
+        if not options['all']:
+            # 'processing' rows were cut off mid-run by a worker restart
+            sources = sources.exclude(processing_status='processed')
+        ids = list(sources.values_list('id', flat=True))
+        
+        self.stdout.write(f'📥 Ingesting {len(ids)} data source(s)...\n')
+        for data_source_id in ids:
+            process_data_source_task(data_source_id)
+        
+        counts = {
+            status: DataSource.objects.filter(id__in=ids, processing_status=status).count()
+            for status in ('processed', 'failed', 'pending')
+        }
+        self.stdout.write(self.style.SUCCESS(
+            f"\n✅ Done: {counts['processed']} ingested, {counts['failed']} failed, "
+            f"{counts['pending']} not ingestible yet"
+        ))
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('explainable_ai', '0003_allocationrequest_explanationrequest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datasource',
+            name='processing_status',
+            field=models.CharField(choices=[('pending', 'Pending Ingestion'), ('processing', 'Being Ingested'), ('processed', 'Ingested'), ('failed', 'Ingestion Failed')], default='pending', help_text='Whether the source has been ingested into the knowledge base', max_length=20),
+        ),
+    ]
@@ -405,6 +405,13 @@ class DataSource(models.Model):
         ('document', 'Text Document'),
     ]
     
+    PROCESSING_STATUS_CHOICES = [
+        ('pending', 'Pending Ingestion'),
+        ('processing', 'Being Ingested'),
+        ('processed', 'Ingested'),
+        ('failed', 'Ingestion Failed'),
+    ]
+    
     CATEGORY_CHOICES = [
         ('policy', 'Policy Document'),
         ('research', 'Research Paper'),
@@ -439,6 +446,12 @@ class DataSource(models.Model):
     usage_count = models.IntegerField(default=0, help_text="Number of times referenced by AI")
     last_used = models.DateTimeField(blank=True, null=True)
     
+    # Knowledge Ingestion
+    processing_status = models.CharField(
+        max_length=20, choices=PROCESSING_STATUS_CHOICES, default='pending',
+        help_text="Whether the source has been ingested into the knowledge base"
+    )
+    
     # Admin
     added_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='data_sources_added')
     created_at = models.DateTimeField(auto_now_add=True)
@@ -342,11 +342,11 @@ class DataSourceSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'description', 'source_type', 'category',
             'url', 'file', 'author', 'published_date', 'tags',
-            'summary', 'key_points', 'is_active', 'usage_count',
+            'summary', 'key_points', 'is_active', 'processing_status', 'usage_count',
             'last_used', 'added_by', 'added_by_username', 'created_at',
             'updated_at', 'source_location', 'content_preview'
         ]
-        read_only_fields = ['usage_count', 'last_used', 'created_at', 'updated_at']
+        read_only_fields = ['processing_status', 'usage_count', 'last_used', 'created_at', 'updated_at']
     
     def get_content_preview(self, obj):
         return obj.get_content_preview()
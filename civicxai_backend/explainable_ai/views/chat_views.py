@@ -17,7 +17,9 @@ from metta.metta_engine import metta_engine
 from ..models import DataSource
 
 # Phase 4: Cognitive AI Integration
-from cognitive.orchestrator.orchestrator import get_orchestrator, RoutingDecision
+from cognitive.orchestrator.orchestrator import (
+    get_orchestrator, RoutingDecision, FLAG_DOCUMENTS, FLAG_MULTI_HOP
+)
 from cognitive.core.hybrid_responder import get_hybrid_responder
 from cognitive.reasoner.reasoner import get_reasoner
 from cognitive.knowledge.knowledge_store import get_knowledge_store
@@ -223,14 +225,14 @@ class AIChatView(APIView):
         orchestrator = get_orchestrator()
         routing_decision = orchestrator.route_query(message)
         
-        routing = routing_decision['routing']
-        analysis = routing_decision['analysis']
+        routing = routing_decision.routing
+        analysis = routing_decision.analysis
         
         # Log routing decision
-        print(f"🧠 Cognitive Orchestrator: {routing.value} ({routing_decision['rationale']})")
+        print(f"🧠 Cognitive Orchestrator: {routing.value} ({routing_decision.rationale})")
         
         # Check for document queries first (Phase 4 key deliverable)
-        if analysis['requires_documents']:
+        if analysis.flags & FLAG_DOCUMENTS:
             return self._handle_document_query(message, analysis)
         
         # Route based on orchestrator decision
@@ -540,7 +542,7 @@ class AIChatView(APIView):
             reasoner = get_reasoner()
             
             # Extract search terms
-            keywords = analysis['keywords']
+            keywords = analysis.keywords
             
             # Find relevant sources
             matching_sources = []
@@ -595,9 +597,9 @@ class AIChatView(APIView):
             reasoner = get_reasoner()
             
             # Determine reasoning type
-            if analysis['requires_multi_hop']:
+            if analysis.flags & FLAG_MULTI_HOP:
                 # Multi-hop inference
-                keywords = analysis['keywords']
+                keywords = analysis.keywords
                 if len(keywords) >= 2:
                     result = reasoner.multi_hop_inference(keywords[0], keywords[-1])
                     if result.get('success'):
@@ -615,11 +617,11 @@ class AIChatView(APIView):
             # Default cognitive response
             response = "**Cognitive Analysis**\n\n"
             response += "This query requires complex reasoning. "
-            response += f"Analyzing: {', '.join(analysis['keywords'])}\n\n"
+            response += f"Analyzing: {', '.join(analysis.keywords)}\n\n"
             
             # Get related concepts
-            if analysis['keywords']:
-                related = reasoner.find_related_concepts(analysis['keywords'][0])
+            if analysis.keywords:
+                related = reasoner.find_related_concepts(analysis.keywords[0])
                 if related:
                     response += f"**Related Concepts:** {', '.join(related[:5])}\n"
             
@@ -672,7 +674,7 @@ class AIChatView(APIView):
             gateway_result = self._handle_analysis(message, None)
             
             # Enhance with reasoning
-            context = {'topics': analysis['keywords']}
+            context = {'topics': analysis.keywords}
             
             enhanced_result = hybrid_responder.combine_gateway_with_reasoning(
                 gateway_result, message, context